@@ -0,0 +1,44 @@
+"""Add index on refresh_tokens.expires_at
+
+Revision ID: 006
+Revises: 005_email_verification
+Create Date: 2026-10-16
+
+"""
+from typing import Sequence, Union
+from alembic import op
+import os
+import sys
+
+# Add the project root to the path to import settings
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
+from app.core.config import settings
+
+# revision identifiers, used by Alembic.
+revision: str = '006'
+down_revision: Union[str, None] = '005_email_verification'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Expired-token cleanup filters on expires_at; build the index without
+    # blocking writes (CONCURRENTLY cannot run inside a transaction)
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_refresh_tokens_expires_at',
+            'refresh_tokens',
+            ['expires_at'],
+            schema=settings.DATABASE_SCHEMA,
+            postgresql_concurrently=True
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            'ix_refresh_tokens_expires_at',
+            table_name='refresh_tokens',
+            schema=settings.DATABASE_SCHEMA,
+            postgresql_concurrently=True
+        )
@@ -0,0 +1,47 @@
+"""Add partial index on refresh_tokens.user_id for active tokens
+
+Revision ID: 007
+Revises: 006
+Create Date: 2026-10-16
+
+"""
+from typing import Sequence, Union
+from alembic import op
+import sqlalchemy as sa
+import os
+import sys
+
+# Add the project root to the path to import settings
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
+from app.core.config import settings
+
+# revision identifiers, used by Alembic.
+revision: str = '007'
+down_revision: Union[str, None] = '006'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Serves the bulk "revoke all tokens for a user" UPDATE, which only
+    # touches active tokens; indexing just those rows keeps the index small
+    # as revoked tokens accumulate
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_refresh_tokens_user_active',
+            'refresh_tokens',
+            ['user_id'],
+            schema=settings.DATABASE_SCHEMA,
+            postgresql_where=sa.text('is_revoked = false'),
+            postgresql_concurrently=True
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            'ix_refresh_tokens_user_active',
+            table_name='refresh_tokens',
+            schema=settings.DATABASE_SCHEMA,
+            postgresql_concurrently=True
+        )
@@ -13,6 +13,7 @@ from app.services.token_service import TokenService, create_access_token
 from app.services.forgot_password_service import ForgotPasswordService
 from app.services.reset_password_service import ResetPasswordService
 from app.services.email_verification_service import EmailVerificationService
+from app.repositories.user_repository import UserRepository
 from app.api.dependencies import get_current_user
 from app.models.user import User
 from app.core.config import settings
@@ -142,15 +143,21 @@ async def refresh_access_token(
 
     # Verify refresh token
     token_service = TokenService(db)
-    refresh_token_obj = await token_service.verify_refresh_token(token)
+    token_info = await token_service.verify_refresh_token(token)
 
-    if not refresh_token_obj:
+    if not token_info:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Invalid or expired refresh token"
         )
 
-    user = refresh_token_obj.user
+    user = await UserRepository(db).get_by_id(token_info.user_id)
+
+    if not user:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Invalid or expired refresh token"
+        )
 
     # Create new access token
     access_token = create_access_token(user)
@@ -20,6 +20,8 @@ class Settings(BaseSettings):
     DATABASE_SCHEMA: str = "public"
     DATABASE_POOL_SIZE: int = 20
     DATABASE_MAX_OVERFLOW: int = 10
+    DATABASE_POOL_RECYCLE: int = 1800  # seconds
+    DATABASE_POOL_WARMUP: int = 5  # connections opened at startup
     
     # JWT
     SECRET_KEY: str
@@ -28,6 +30,13 @@ class Settings(BaseSettings):
     REFRESH_TOKEN_EXPIRE_DAYS: int = 30
     REFRESH_TOKEN_ROTATION_ENABLED: bool = True
 
+    # Password hashing
+    PASSWORD_HASH_ROUNDS: int = 12  # bcrypt cost factor (log2 rounds)
+
+    # Current-user cache (per process)
+    USER_CACHE_TTL_SECONDS: int = 30
+    USER_CACHE_MAXSIZE: int = 10000
+
     # Password Reset
     FRONTEND_URL: str = "http://localhost:3000"
     PASSWORD_RESET_TOKEN_EXPIRE_HOURS: int = 24
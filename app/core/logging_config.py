@@ -0,0 +1,29 @@
+"""Logging configuration"""
+
+import logging
+import sys
+
+from pythonjsonlogger import jsonlogger
+
+from app.core.config import settings
+
+
+def setup_logging() -> None:
+    """
+    Configure the root logger to write one JSON object per line
+
+    Fields passed through ``extra=`` on a log call are emitted as top-level
+    JSON keys, so services log an event name plus structured fields instead
+    of pre-formatted strings.
+    """
+    handler = logging.StreamHandler(sys.stdout)
+    handler.setFormatter(
+        jsonlogger.JsonFormatter(
+            "%(asctime)s %(levelname)s %(name)s %(message)s",
+            rename_fields={"levelname": "level", "name": "logger"},
+        )
+    )
+
+    root_logger = logging.getLogger()
+    root_logger.handlers = [handler]
+    root_logger.setLevel(settings.LOG_LEVEL)
@@ -1,10 +1,22 @@
 from datetime import datetime, timedelta
 from typing import Optional
-from jose import JWTError, jwt
+from jose import JWTError, jwk, jwt
 from passlib.context import CryptContext
 from app.core.config import settings
 
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+pwd_context = CryptContext(
+    schemes=["bcrypt"],
+    deprecated="auto",
+    bcrypt__rounds=settings.PASSWORD_HASH_ROUNDS
+)
+
+# Built once: python-jose otherwise re-parses the secret and constructs the
+# key object on every encode/decode
+_JWT_KEY = jwk.construct(settings.SECRET_KEY, settings.ALGORITHM)
+_JWT_ALGORITHMS = [settings.ALGORITHM]
+_JWT_DECODE_OPTIONS = {"require_exp": True, "require_sub": True}
+_ACCESS_CLAIMS = {"type": "access"}
+_REFRESH_CLAIMS = {"type": "refresh"}
 
 
 class SecurityService:
@@ -37,8 +49,6 @@ class SecurityService:
     @staticmethod
     def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -> str:
         """Create JWT access token"""
-        to_encode = data.copy()
-        
         if expires_delta:
             expire = datetime.utcnow() + expires_delta
         else:
@@ -46,20 +56,19 @@ class SecurityService:
                 minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES
             )
         
-        to_encode.update({"exp": expire, "type": "access"})
+        to_encode = {**data, **_ACCESS_CLAIMS, "exp": expire}
         encoded_jwt = jwt.encode(
-            to_encode, settings.SECRET_KEY, algorithm=settings.ALGORITHM
+            to_encode, _JWT_KEY, algorithm=settings.ALGORITHM
         )
         return encoded_jwt
     
     @staticmethod
     def create_refresh_token(data: dict) -> str:
         """Create JWT refresh token"""
-        to_encode = data.copy()
         expire = datetime.utcnow() + timedelta(days=settings.REFRESH_TOKEN_EXPIRE_DAYS)
-        to_encode.update({"exp": expire, "type": "refresh"})
+        to_encode = {**data, **_REFRESH_CLAIMS, "exp": expire}
         encoded_jwt = jwt.encode(
-            to_encode, settings.SECRET_KEY, algorithm=settings.ALGORITHM
+            to_encode, _JWT_KEY, algorithm=settings.ALGORITHM
         )
         return encoded_jwt
     
@@ -68,7 +77,7 @@ class SecurityService:
         """Decode and verify JWT token"""
         try:
             payload = jwt.decode(
-                token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM]
+                token, _JWT_KEY, algorithms=_JWT_ALGORITHMS, options=_JWT_DECODE_OPTIONS
             )
             return payload
         except JWTError:
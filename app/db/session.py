@@ -1,13 +1,19 @@
+import asyncio
+import logging
+from sqlalchemy import text
 from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession, async_sessionmaker
 from sqlalchemy.orm import declarative_base
 from app.core.config import settings
 
+logger = logging.getLogger(__name__)
+
 # Create async engine
 engine = create_async_engine(
     settings.DATABASE_URL,
     echo=settings.DEBUG,
     pool_size=settings.DATABASE_POOL_SIZE,
     max_overflow=settings.DATABASE_MAX_OVERFLOW,
+    pool_recycle=settings.DATABASE_POOL_RECYCLE,
     pool_pre_ping=True,
 )
 
@@ -24,6 +30,23 @@ AsyncSessionLocal = async_sessionmaker(
 Base = declarative_base()
 
 
+async def warm_up_pool(connections: int) -> None:
+    """
+    Open pooled connections up front so the first requests skip connect latency
+
+    Failures are only logged; requests connect on demand as before.
+    """
+    async def _ping():
+        async with engine.connect() as conn:
+            await conn.execute(text("SELECT 1"))
+
+    # Run concurrently so each ping checks out a distinct connection
+    try:
+        await asyncio.gather(*(_ping() for _ in range(connections)))
+    except Exception as e:
+        logger.warning("db_pool_warm_up_failed", extra={"error": str(e)})
+
+
 async def get_db() -> AsyncSession:
     """Dependency to get database session"""
     async with AsyncSessionLocal() as session:
@@ -1,15 +1,32 @@
+from contextlib import asynccontextmanager
 from fastapi import FastAPI, status
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse
 from app.core.config import settings
+from app.core.logging_config import setup_logging
 from app.api.v1 import auth
+from app.db.session import warm_up_pool
+from app.services.sqs_producer import notification_producer
+
+setup_logging()
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Warm up the DB pool, start the SQS batch publisher and flush it on shutdown"""
+    await warm_up_pool(settings.DATABASE_POOL_WARMUP)
+    await notification_producer.start()
+    yield
+    await notification_producer.stop()
+
 
 app = FastAPI(
     title=settings.APP_NAME,
     version=settings.APP_VERSION,
     description="Herm Auth Service",
     docs_url="/docs",
-    redoc_url="/redoc"
+    redoc_url="/redoc",
+    lifespan=lifespan
 )
 
 # CORS middleware
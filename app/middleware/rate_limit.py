@@ -1,7 +1,7 @@
 """
 Rate limiting middleware for API endpoints
 
-This provides simple in-memory rate limiting based on IP address.
+This provides simple in-memory rate limiting per endpoint and IP address.
 For production use with multiple workers, consider using Redis-based rate limiting.
 """
 
@@ -11,6 +11,9 @@ from datetime import datetime, timedelta
 from collections import defaultdict
 import threading
 
+# (scope, client IP) a request is counted under
+RateLimitKey = Tuple[str, str]
+
 
 class RateLimiter:
     """
@@ -22,8 +25,10 @@ class RateLimiter:
     """
 
     def __init__(self):
-        # Store: IP -> (request_count, window_start_time)
-        self._storage: Dict[str, Tuple[int, datetime]] = defaultdict(lambda: (0, datetime.utcnow()))
+        # Store: (scope, IP) -> (request_count, window_start_time)
+        self._storage: Dict[RateLimitKey, Tuple[int, datetime]] = defaultdict(
+            lambda: (0, datetime.utcnow())
+        )
         self._lock = threading.Lock()
 
     def _get_client_ip(self, request: Request) -> str:
@@ -41,7 +46,7 @@ class RateLimiter:
         """Remove expired entries from storage"""
         now = datetime.utcnow()
         expired_keys = [
-            ip for ip, (_, window_start) in self._storage.items()
+            key for key, (_, window_start) in self._storage.items()
             if now - window_start > timedelta(seconds=window_seconds * 2)  # Clean up after 2x window
         ]
 
@@ -51,21 +56,26 @@ class RateLimiter:
     async def check_rate_limit(
         self,
         request: Request,
+        scope: str,
         max_requests: int,
         window_seconds: int
     ) -> None:
         """
         Check if request exceeds rate limit
 
+        Each scope counts separately, so hitting one endpoint's limit
+        doesn't block the others for the same client.
+
         Args:
             request: FastAPI request object
+            scope: Name of the limited endpoint
             max_requests: Maximum number of requests allowed
             window_seconds: Time window in seconds
 
         Raises:
             HTTPException: 429 Too Many Requests if limit exceeded
         """
-        client_ip = self._get_client_ip(request)
+        key = (scope, self._get_client_ip(request))
         now = datetime.utcnow()
 
         with self._lock:
@@ -74,7 +84,7 @@ class RateLimiter:
                 self._cleanup_expired_entries(window_seconds)
 
             # Get current count and window start
-            count, window_start = self._storage[client_ip]
+            count, window_start = self._storage[key]
 
             # Check if we're still in the same window
             if now - window_start < timedelta(seconds=window_seconds):
@@ -88,10 +98,10 @@ class RateLimiter:
                     )
 
                 # Increment counter
-                self._storage[client_ip] = (count + 1, window_start)
+                self._storage[key] = (count + 1, window_start)
             else:
                 # New window - reset counter
-                self._storage[client_ip] = (1, now)
+                self._storage[key] = (1, now)
 
 
 # Global rate limiter instance
@@ -105,9 +115,8 @@ async def rate_limit_forgot_password(request: Request):
 
     Limit: 3 requests per 15 minutes (900 seconds)
     """
-    import asyncio
-    return asyncio.create_task(
-        rate_limiter.check_rate_limit(request, max_requests=3, window_seconds=900)
+    await rate_limiter.check_rate_limit(
+        request, scope="forgot_password", max_requests=3, window_seconds=900
     )
 
 
@@ -117,9 +126,8 @@ async def rate_limit_reset_password(request: Request):
 
     Limit: 5 requests per 15 minutes (900 seconds)
     """
-    import asyncio
-    return asyncio.create_task(
-        rate_limiter.check_rate_limit(request, max_requests=5, window_seconds=900)
+    await rate_limiter.check_rate_limit(
+        request, scope="reset_password", max_requests=5, window_seconds=900
     )
 
 
@@ -129,9 +137,8 @@ async def rate_limit_login(request: Request):
 
     Limit: 5 requests per 5 minutes (300 seconds)
     """
-    import asyncio
-    return asyncio.create_task(
-        rate_limiter.check_rate_limit(request, max_requests=5, window_seconds=300)
+    await rate_limiter.check_rate_limit(
+        request, scope="login", max_requests=5, window_seconds=300
     )
 
 
@@ -141,7 +148,6 @@ async def rate_limit_resend_verification(request: Request):
 
     Limit: 3 requests per 15 minutes (900 seconds)
     """
-    import asyncio
-    return asyncio.create_task(
-        rate_limiter.check_rate_limit(request, max_requests=3, window_seconds=900)
+    await rate_limiter.check_rate_limit(
+        request, scope="resend_verification", max_requests=3, window_seconds=900
     )
\ No newline at end of file
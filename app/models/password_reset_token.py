@@ -15,7 +15,13 @@ class PasswordResetToken(Base):
     __table_args__ = {"schema": settings.DATABASE_SCHEMA}
 
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
-    token = Column(String(64), unique=True, nullable=False, index=True)
+    token = Column(
+        String(64),
+        unique=True,
+        nullable=False,
+        index=True,
+        default=lambda: PasswordResetToken.generate_token()
+    )
     user_id = Column(UUID(as_uuid=True), ForeignKey(f"{settings.DATABASE_SCHEMA}.users.id", ondelete="CASCADE"), nullable=False)
     expires_at = Column(DateTime(timezone=False), nullable=False)
     is_used = Column(Boolean, default=False, nullable=False)
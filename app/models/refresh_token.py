@@ -1,4 +1,4 @@
-from sqlalchemy import Column, String, DateTime, ForeignKey, Boolean
+from sqlalchemy import Column, String, DateTime, ForeignKey, Boolean, Index, text
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
@@ -13,10 +13,24 @@ class RefreshToken(Base):
     """Refresh token model for managing user sessions"""
 
     __tablename__ = "refresh_tokens"
-    __table_args__ = {"schema": settings.DATABASE_SCHEMA}
+    __table_args__ = (
+        Index(
+            "ix_refresh_tokens_user_active",
+            "user_id",
+            postgresql_where=text("is_revoked = false")
+        ),
+        Index("ix_refresh_tokens_expires_at", "expires_at"),
+        {"schema": settings.DATABASE_SCHEMA},
+    )
 
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
-    token = Column(String(255), unique=True, index=True, nullable=False)
+    token = Column(
+        String(255),
+        unique=True,
+        index=True,
+        nullable=False,
+        default=lambda: RefreshToken.generate_token()
+    )
     user_id = Column(UUID(as_uuid=True), ForeignKey(f"{settings.DATABASE_SCHEMA}.users.id"), nullable=False)
     expires_at = Column(DateTime(timezone=True), nullable=False)
     is_revoked = Column(Boolean, default=False, nullable=False)
@@ -1,9 +1,25 @@
 from typing import Optional
 from uuid import UUID
 from sqlalchemy import select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import make_transient_to_detached
+from app.core.cache import TTLCache
+from app.core.config import settings
 from app.models.user import User
 
+# Column values of recently seen active users, keyed by user id
+_user_cache = TTLCache(
+    maxsize=settings.USER_CACHE_MAXSIZE,
+    ttl=settings.USER_CACHE_TTL_SECONDS
+)
+_USER_COLUMNS = tuple(column.key for column in User.__table__.columns)
+
+
+def invalidate_cached_user(user_id: UUID) -> None:
+    """Drop a user from the current-user cache after it changes"""
+    _user_cache.invalidate(user_id)
+
 
 class UserRepository:
     """Repository for User database operations"""
@@ -11,13 +27,23 @@ class UserRepository:
     def __init__(self, db: AsyncSession):
         self.db = db
     
-    async def create(self, email: str, hashed_password: str) -> User:
-        """Create a new user"""
-        user = User(email=email, hashed_password=hashed_password)
-        self.db.add(user)
-        await self.db.flush()
-        await self.db.refresh(user)
-        return user
+    async def create(self, email: str, hashed_password: str) -> Optional[User]:
+        """
+        Create a new user
+
+        Uses INSERT ... ON CONFLICT (email) DO NOTHING RETURNING, so the
+        existence check and insert are one race-free statement.
+
+        Returns:
+            The created user, or None if the email is already registered
+        """
+        result = await self.db.execute(
+            pg_insert(User)
+            .values(email=email, hashed_password=hashed_password)
+            .on_conflict_do_nothing(index_elements=[User.email])
+            .returning(User)
+        )
+        return result.scalar_one_or_none()
     
     async def get_by_id(self, user_id: UUID) -> Optional[User]:
         """Get user by ID"""
@@ -26,6 +52,28 @@ class UserRepository:
         )
         return result.scalar_one_or_none()
     
+    async def get_active_by_id_cached(self, user_id: UUID) -> Optional[User]:
+        """
+        Get user by ID, serving active users from a short-lived cache
+
+        Each hit builds a fresh detached User from the cached column values,
+        so no instance is shared between sessions. Inactive users are never
+        cached, so deactivation takes effect once the TTL runs out.
+        """
+        values = _user_cache.get(user_id)
+        if values is not None:
+            user = User(**values)
+            make_transient_to_detached(user)
+            return user
+
+        user = await self.get_by_id(user_id)
+        if user and user.is_active:
+            _user_cache.set(
+                user_id,
+                {column: getattr(user, column) for column in _USER_COLUMNS}
+            )
+        return user
+
     async def get_by_email(self, email: str) -> Optional[User]:
         """Get user by email"""
         result = await self.db.execute(
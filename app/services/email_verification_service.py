@@ -7,6 +7,7 @@ from fastapi import HTTPException, status
 from app.models.user import User
 from app.models.email_verification_token import EmailVerificationToken
 from app.services.sqs_producer import notification_producer
+from app.repositories.user_repository import invalidate_cached_user
 from app.core.config import settings
 import logging
 
@@ -85,7 +86,7 @@ class EmailVerificationService:
         user_name = user.email.split('@')[0]
 
         # Send email verification notification via SQS
-        message_id = notification_producer.send_email_verification(
+        message_id = await notification_producer.send_email_verification(
             email=user.email,
             user_name=user_name,
             verification_link=verification_link,
@@ -220,6 +221,7 @@ class EmailVerificationService:
 
         # Commit changes
         await self.db.commit()
+        invalidate_cached_user(user.id)
         
         # Refresh user to get updated data
         await self.db.refresh(user)
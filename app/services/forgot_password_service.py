@@ -1,6 +1,8 @@
+import asyncio
+import time
 from typing import Optional
 from uuid import UUID, uuid4
-from sqlalchemy import select, and_
+from sqlalchemy import select, and_, lambda_stmt
 from sqlalchemy.ext.asyncio import AsyncSession
 from datetime import datetime, timedelta
 from app.models.user import User
@@ -11,6 +13,12 @@ import logging
 
 logger = logging.getLogger(__name__)
 
+# Minimum time process_forgot_password takes whether or not the email
+# exists, so response timing doesn't reveal which accounts are registered.
+# This is a floor, not a measured latency: if the found path regularly
+# takes longer, raise it.
+MIN_RESPONSE_SECONDS = 0.15
+
 
 class ForgotPasswordService:
     """Service for handling forgot password functionality"""
@@ -18,6 +26,15 @@ class ForgotPasswordService:
     def __init__(self, db: AsyncSession):
         self.db = db
 
+    async def get_user_language_code(self, user_id: UUID) -> str:
+        """
+        Get user's preferred language code
+
+        Placeholder until users store a language preference; the language
+        sent by the frontend is used for notifications instead.
+        """
+        return "en"
+
     async def create_reset_token(
         self,
         user_id: UUID,
@@ -27,10 +44,12 @@ class ForgotPasswordService:
         """Create password reset token and invalidate old ones"""
         # Invalidate existing unused tokens for this user
         result = await self.db.execute(
-            select(PasswordResetToken).where(
-                and_(
-                    PasswordResetToken.user_id == user_id,
-                    PasswordResetToken.is_used == False
+            lambda_stmt(
+                lambda: select(PasswordResetToken).where(
+                    and_(
+                        PasswordResetToken.user_id == user_id,
+                        PasswordResetToken.is_used == False
+                    )
                 )
             )
         )
@@ -44,6 +63,7 @@ class ForgotPasswordService:
             token=PasswordResetToken.generate_token(),
             user_id=user_id,
             expires_at=datetime.utcnow() + timedelta(hours=expiry_hours),
+            is_used=False,
             ip_address=ip_address
         )
 
@@ -63,7 +83,9 @@ class ForgotPasswordService:
         """
         Main method - returns True if email queued, False if user not found
 
-        NOTE: Always returns success to frontend to prevent email enumeration
+        NOTE: Always returns success to frontend to prevent email enumeration.
+        Both normal outcomes are padded to MIN_RESPONSE_SECONDS for the same
+        reason.
 
         Args:
             email: User's email address
@@ -71,19 +93,33 @@ class ForgotPasswordService:
             ip_address: IP address for audit trail
             expiry_hours: Token expiry time in hours
         """
-        # Check if user exists
+        started = time.monotonic()
+        queued = await self._queue_reset_email(email, language, ip_address, expiry_hours)
+        # Errors propagate unpadded; only the two normal outcomes need to match
+        await asyncio.sleep(max(0.0, MIN_RESPONSE_SECONDS - (time.monotonic() - started)))
+        return queued
+
+    async def _queue_reset_email(
+        self,
+        email: str,
+        language: str,
+        ip_address: Optional[str],
+        expiry_hours: int
+    ) -> bool:
+        """Create a reset token and queue the email; False if user not found"""
+        # Check if user exists (only the id is needed)
         result = await self.db.execute(
-            select(User).where(User.email == email)
+            lambda_stmt(lambda: select(User.id).where(User.email == email))
         )
-        user = result.scalar_one_or_none()
+        user_id = result.scalar_one_or_none()
 
-        if not user:
+        if user_id is None:
             # Don't reveal that user doesn't exist (security)
-            logger.info(f"Password reset requested for non-existent email: {email}")
+            logger.info("password_reset_unknown_email", extra={"user_email": email})
             return False
 
         # Create reset token
-        reset_token = await self.create_reset_token(user.id, ip_address, expiry_hours)
+        reset_token = await self.create_reset_token(user_id, ip_address, expiry_hours)
 
         # Build reset link
         reset_link = f"{settings.FRONTEND_URL}/reset-password?token={reset_token.token}"
@@ -92,19 +128,24 @@ class ForgotPasswordService:
         user_name = email.split('@')[0]
 
         # Send password reset notification via SQS
-        message_id = notification_producer.send_password_reset(
+        message_id = await notification_producer.send_password_reset(
             email=email,
             user_name=user_name,
             reset_link=reset_link,
             expiry_hours=expiry_hours,
-            user_id=user.id,
+            user_id=user_id,
             language=language,  # Use language from request
             correlation_id=str(uuid4())
         )
 
         logger.info(
-            f"Queued password reset notification: {message_id} "
-            f"for user: {email} (language: {language}, expires in {expiry_hours} hours)"
+            "queued_password_reset",
+            extra={
+                "message_id": message_id,
+                "user_email": email,
+                "language": language,
+                "expiry_hours": expiry_hours
+            }
         )
 
         return True
\ No newline at end of file
@@ -81,24 +81,36 @@ class NotificationService:
             )
 
             logger.info(
-                f"Email notification sent to SQS queue - "
-                f"Template: {template_slug}, Recipient: {recipient_email}, "
-                f"Correlation ID: {correlation_id}, Message ID: {response.get('MessageId')}"
+                "email_notification_sent",
+                extra={
+                    "template_slug": template_slug,
+                    "recipient_email": recipient_email,
+                    "correlation_id": correlation_id,
+                    "message_id": response.get('MessageId')
+                }
             )
             return True
 
         except ClientError as e:
             logger.error(
-                f"Failed to send email notification to SQS - "
-                f"Template: {template_slug}, Recipient: {recipient_email}, "
-                f"Correlation ID: {correlation_id}, Error: {str(e)}"
+                "email_notification_failed",
+                extra={
+                    "template_slug": template_slug,
+                    "recipient_email": recipient_email,
+                    "correlation_id": correlation_id,
+                    "error": str(e)
+                }
             )
             return False
         except Exception as e:
             logger.error(
-                f"Unexpected error sending email notification - "
-                f"Template: {template_slug}, Recipient: {recipient_email}, "
-                f"Correlation ID: {correlation_id}, Error: {str(e)}"
+                "email_notification_unexpected_error",
+                extra={
+                    "template_slug": template_slug,
+                    "recipient_email": recipient_email,
+                    "correlation_id": correlation_id,
+                    "error": str(e)
+                }
             )
             return False
 
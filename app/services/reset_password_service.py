@@ -1,12 +1,14 @@
+import asyncio
 from typing import Optional
-from sqlalchemy import select
+from sqlalchemy import select, lambda_stmt
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import selectinload
 from datetime import datetime
 from fastapi import HTTPException, status
 from app.models.password_reset_token import PasswordResetToken
-from app.models.user import User
 from app.core.security import security_service
 from app.services.token_service import TokenService
+from app.repositories.user_repository import invalidate_cached_user
 import logging
 
 logger = logging.getLogger(__name__)
@@ -23,22 +25,33 @@ class ResetPasswordService:
         """
         Verify password reset token
 
+        The token's user is eager-loaded so callers can use reset_token.user
+        without issuing another query.
+
         Returns:
             PasswordResetToken if valid, None otherwise
         """
         result = await self.db.execute(
-            select(PasswordResetToken).where(PasswordResetToken.token == token)
+            lambda_stmt(
+                lambda: select(PasswordResetToken)
+                .options(selectinload(PasswordResetToken.user))
+                .where(PasswordResetToken.token == token)
+            )
         )
         reset_token = result.scalar_one_or_none()
 
         if not reset_token:
-            logger.warning(f"Password reset attempted with non-existent token")
+            logger.warning("password_reset_unknown_token")
             return None
 
         if not reset_token.is_valid():
             logger.warning(
-                f"Password reset attempted with invalid token for user {reset_token.user_id} "
-                f"(expired: {reset_token.is_expired()}, used: {reset_token.is_used})"
+                "password_reset_invalid_token",
+                extra={
+                    "user_id": str(reset_token.user_id),
+                    "expired": reset_token.is_expired(),
+                    "used": reset_token.is_used
+                }
             )
             return None
 
@@ -73,14 +86,11 @@ class ResetPasswordService:
                 detail="Invalid or expired password reset token"
             )
 
-        # Get user
-        result = await self.db.execute(
-            select(User).where(User.id == reset_token.user_id)
-        )
-        user = result.scalar_one_or_none()
+        # User is eager-loaded with the token
+        user = reset_token.user
 
         if not user:
-            logger.error(f"User not found for valid token: {reset_token.user_id}")
+            logger.error("password_reset_user_missing", extra={"user_id": str(reset_token.user_id)})
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail="User not found"
@@ -88,14 +98,16 @@ class ResetPasswordService:
 
         # Check if user is active
         if not user.is_active:
-            logger.warning(f"Password reset attempted for inactive user: {user.email}")
+            logger.warning("password_reset_inactive_user", extra={"user_email": user.email})
             raise HTTPException(
                 status_code=status.HTTP_403_FORBIDDEN,
                 detail="User account is inactive"
             )
 
-        # Hash new password
-        hashed_password = security_service.get_password_hash(new_password)
+        # Hash new password off the event loop (bcrypt is CPU-bound)
+        hashed_password = await asyncio.to_thread(
+            security_service.get_password_hash, new_password
+        )
 
         # Update user password
         user.hashed_password = hashed_password
@@ -111,10 +123,11 @@ class ResetPasswordService:
 
         # Commit all changes
         await self.db.commit()
+        invalidate_cached_user(user.id)
 
         logger.info(
-            f"Password successfully reset for user: {user.email} "
-            f"(from IP: {ip_address or 'unknown'})"
+            "password_reset_completed",
+            extra={"user_email": user.email, "ip_address": ip_address or "unknown"}
         )
 
         return True
@@ -126,9 +139,12 @@ class ResetPasswordService:
         Returns:
             Number of tokens deleted
         """
+        now = datetime.utcnow()
         result = await self.db.execute(
-            select(PasswordResetToken).where(
-                PasswordResetToken.expires_at < datetime.utcnow()
+            lambda_stmt(
+                lambda: select(PasswordResetToken).where(
+                    PasswordResetToken.expires_at < now
+                )
             )
         )
         expired_tokens = result.scalars().all()
@@ -138,5 +154,5 @@ class ResetPasswordService:
 
         await self.db.commit()
 
-        logger.info(f"Cleaned up {len(expired_tokens)} expired password reset tokens")
+        logger.info("password_reset_tokens_cleaned", extra={"count": len(expired_tokens)})
         return len(expired_tokens)
@@ -1,10 +1,12 @@
 """SQS Producer for sending notifications to the notification service"""
 
 from uuid import UUID, uuid4
-import json
+import asyncio
+import hashlib
 import logging
 from typing import Optional
-import boto3
+import aioboto3
+from aiobotocore.config import AioConfig
 from app.core.config import settings
 from app.schemas.user import (
     NotificationMessage,
@@ -15,20 +17,44 @@ from app.schemas.user import (
 
 logger = logging.getLogger(__name__)
 
+# SendMessageBatch accepts at most 10 entries per call
+MAX_BATCH_SIZE = 10
+# How long the flusher waits for a batch to fill before sending a partial one
+BATCH_WAIT_SECONDS = 0.05
+# Buffered messages allowed before send_* calls wait for the flusher
+MAX_BUFFERED_MESSAGES = 1000
+# HTTP connections the SQS client may keep open for concurrent batch sends
+MAX_POOL_CONNECTIONS = 50
+
+SOURCE_SERVICE = "auth-service"
+
 
 class NotificationProducer:
-    """SQS producer for sending notifications"""
+    """
+    SQS producer for sending notifications
+
+    send_* calls only buffer the message; a background task drains the
+    buffer and publishes it with SendMessageBatch, so request handlers
+    don't wait on an SQS round-trip.
+    """
 
     def __init__(self):
         """
-        Initialize SQS client
-        
+        Prepare SQS client configuration
+
+        The aioboto3 client itself is opened in start() and shared by every
+        publish, so its connection pool is reused for the app's lifetime.
+
         In ECS, uses IAM task role credentials automatically.
         In local development, can use AWS_ACCESS_KEY_ID and AWS_SECRET_ACCESS_KEY if set.
         """
-        # Build boto3 client config
+        # Build SQS client config
         client_config = {
             'region_name': settings.AWS_REGION,
+            'config': AioConfig(
+                max_pool_connections=MAX_POOL_CONNECTIONS,
+                retries={'max_attempts': 3, 'mode': 'adaptive'}
+            ),
         }
         
         # Only add explicit credentials if they're set (for local development)
@@ -38,55 +64,195 @@ class NotificationProducer:
         if hasattr(settings, 'AWS_SECRET_ACCESS_KEY') and settings.AWS_SECRET_ACCESS_KEY:
             client_config['aws_secret_access_key'] = settings.AWS_SECRET_ACCESS_KEY
         
-        self.sqs_client = boto3.client('sqs', **client_config)
+        self._client_config = client_config
+        self._session = aioboto3.Session()
+        self._client_context = None
+        self.sqs_client = None
         self.queue_url = settings.NOTIFICATION_QUEUE_URL
+        # FIFO queues need a group id and deduplicate on MessageDeduplicationId
+        self.is_fifo = self.queue_url.endswith('.fifo')
+
+        self._buffer: Optional[asyncio.Queue] = None
+        self._flusher: Optional[asyncio.Task] = None
+        # Serializes start()/stop() so concurrent first sends open one client
+        self._lifecycle_lock = asyncio.Lock()
+        # Set by stop(); later sends fail instead of reopening the client
+        self._closed = False
         
-        logger.info(f"SQS Producer initialized for queue: {self.queue_url}")
+        logger.info("sqs_producer_initialized", extra={"queue_url": self.queue_url})
 
-    def _send_message(self, message: NotificationMessage) -> str:
+    async def start(self) -> None:
         """
-        Internal method to send message to SQS
+        Open the SQS client and start the background publishing task
 
-        Args:
-            message: NotificationMessage object
+        Raises:
+            RuntimeError: If the producer has already been stopped
+        """
+        async with self._lifecycle_lock:
+            if self._closed:
+                raise RuntimeError("Notification producer is stopped")
+            if self._flusher is not None and not self._flusher.done():
+                return
 
-        Returns:
-            Message ID from SQS
+            if self.sqs_client is None:
+                self._client_context = self._session.client('sqs', **self._client_config)
+                self.sqs_client = await self._client_context.__aenter__()
+                await self._warm_up()
+
+            self._buffer = asyncio.Queue(maxsize=MAX_BUFFERED_MESSAGES)
+            self._flusher = asyncio.create_task(self._flush_loop())
+
+    async def _warm_up(self) -> None:
+        """
+        Make a cheap SQS call so DNS, TLS and the connection pool are ready
+        before the first notification is published
+
+        Failures are only logged; publishing retries on its own.
         """
         try:
-            response = self.sqs_client.send_message(
+            await self.sqs_client.get_queue_attributes(
                 QueueUrl=self.queue_url,
-                MessageBody=message.model_dump_json(),
-                MessageAttributes={
-                    'template_slug': {
-                        'StringValue': message.template_slug,
-                        'DataType': 'String'
-                    },
-                    'priority': {
-                        'StringValue': message.priority.value,
-                        'DataType': 'String'
-                    },
-                    'language': {
-                        'StringValue': message.language,
-                        'DataType': 'String'
-                    }
-                }
+                AttributeNames=['QueueArn']
             )
-            
-            message_id = response.get('MessageId')
-            logger.info(
-                f"Sent notification to SQS - "
-                f"Template: {message.template_slug}, "
-                f"Language: {message.language}, "
-                f"MessageId: {message_id}"
+        except Exception as e:
+            logger.warning("sqs_warm_up_failed", extra={"error": str(e)})
+
+    async def stop(self) -> None:
+        """
+        Publish any buffered messages, stop the task and close the client
+
+        The producer can't be restarted afterwards: sends made after stop()
+        raise instead of opening a client nobody would close.
+        """
+        async with self._lifecycle_lock:
+            self._closed = True
+
+            if self._flusher is not None:
+                if not self._flusher.done():
+                    await self._buffer.join()
+                    self._flusher.cancel()
+                try:
+                    await self._flusher
+                except asyncio.CancelledError:
+                    pass
+
+                self._flusher = None
+                self._buffer = None
+
+            if self._client_context is not None:
+                await self._client_context.__aexit__(None, None, None)
+                self._client_context = None
+                self.sqs_client = None
+
+    async def _flush_loop(self) -> None:
+        """Drain the buffer in batches of up to MAX_BATCH_SIZE entries"""
+        loop = asyncio.get_running_loop()
+
+        while True:
+            batch = [await self._buffer.get()]
+            deadline = loop.time() + BATCH_WAIT_SECONDS
+
+            while len(batch) < MAX_BATCH_SIZE:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(self._buffer.get(), timeout))
+                except asyncio.TimeoutError:
+                    break
+
+            try:
+                await self._send_batch(batch)
+            finally:
+                for _ in batch:
+                    self._buffer.task_done()
+
+    async def _send_batch(self, entries: list) -> None:
+        """
+        Publish one batch with SendMessageBatch
+
+        Failures are logged rather than raised: callers have already
+        returned by the time a batch is sent.
+        """
+        try:
+            response = await self.sqs_client.send_message_batch(
+                QueueUrl=self.queue_url,
+                Entries=entries
             )
-            return message_id
-            
         except Exception as e:
-            logger.error(f"Failed to send message to SQS: {str(e)}")
-            raise
+            logger.error(
+                "sqs_batch_failed",
+                extra={"batch_size": len(entries), "error": str(e)}
+            )
+            return
+
+        for sent in response.get('Successful', []):
+            logger.info(
+                "sqs_notification_sent",
+                extra={"entry_id": sent['Id'], "message_id": sent.get('MessageId')}
+            )
+        for failed in response.get('Failed', []):
+            logger.error(
+                "sqs_notification_failed",
+                extra={"entry_id": failed['Id'], "error": failed.get('Message')}
+            )
+
+    async def _send_message(self, message: NotificationMessage) -> str:
+        """
+        Internal method to buffer a message for the next SQS batch
+
+        Args:
+            message: NotificationMessage object
+
+        Returns:
+            Client-side entry ID assigned to the message
+
+        Raises:
+            RuntimeError: If the producer has been stopped
+        """
+        if self._closed:
+            raise RuntimeError("Notification producer is stopped")
+        if self._flusher is None or self._flusher.done():
+            await self.start()
+
+        entry_id = uuid4().hex
+        entry = {
+            'Id': entry_id,
+            'MessageBody': message.model_dump_json(),
+            'MessageAttributes': {
+                'template_slug': {
+                    'StringValue': message.template_slug,
+                    'DataType': 'String'
+                },
+                'priority': {
+                    'StringValue': message.priority.value,
+                    'DataType': 'String'
+                },
+                'language': {
+                    'StringValue': message.language,
+                    'DataType': 'String'
+                }
+            }
+        }
+
+        if self.is_fifo:
+            entry['MessageGroupId'] = message.recipient.user_id or "default"
+            entry['MessageDeduplicationId'] = message.metadata["correlation_id"]
+
+        await self._buffer.put(entry)
+        return entry_id
+
+    @staticmethod
+    def _default_correlation_id(template_slug: str, email: str, user_id: str) -> str:
+        """
+        Stable correlation ID for a notification
+
+        Retries of the same notification hash to the same ID, which FIFO
+        queues use as the deduplication ID (5 minute window).
+        """
+        return hashlib.sha256(f"{template_slug}:{email}:{user_id}".encode()).hexdigest()
 
-    def send_welcome(
+    async def send_welcome(
         self,
         email: str,
         user_name: str,
@@ -96,12 +262,13 @@ class NotificationProducer:
         correlation_id: str = None
     ) -> str:
         """Send welcome email notification"""
+        user_id_str = str(user_id)
         message = NotificationMessage(
             channel=Channel.EMAIL,
             template_slug="welcome",
             recipient=RecipientSchema(
                 email=email,
-                user_id=str(user_id),
+                user_id=user_id_str,
                 name=user_name
             ),
             language=language,
@@ -111,14 +278,16 @@ class NotificationProducer:
             },
             priority=Priority.HIGH,
             metadata={
-                "source_service": "auth-service",
-                "correlation_id": correlation_id or str(uuid4()),
-                "user_id": str(user_id)
+                "source_service": SOURCE_SERVICE,
+                "correlation_id": correlation_id or self._default_correlation_id(
+                    "welcome", email, user_id_str
+                ),
+                "user_id": user_id_str
             }
         )
-        return self._send_message(message)
+        return await self._send_message(message)
 
-    def send_password_reset(
+    async def send_password_reset(
         self,
         email: str,
         user_name: str,
@@ -129,12 +298,13 @@ class NotificationProducer:
         correlation_id: str = None
     ) -> str:
         """Send password reset email notification"""
+        user_id_str = str(user_id)
         message = NotificationMessage(
             channel=Channel.EMAIL,
             template_slug="password_reset",
             recipient=RecipientSchema(
                 email=email,
-                user_id=str(user_id),
+                user_id=user_id_str,
                 name=user_name
             ),
             language=language,
@@ -145,14 +315,16 @@ class NotificationProducer:
             },
             priority=Priority.HIGH,
             metadata={
-                "source_service": "auth-service",
-                "correlation_id": correlation_id or str(uuid4()),
-                "user_id": str(user_id)
+                "source_service": SOURCE_SERVICE,
+                "correlation_id": correlation_id or self._default_correlation_id(
+                    "password_reset", email, user_id_str
+                ),
+                "user_id": user_id_str
             }
         )
-        return self._send_message(message)
+        return await self._send_message(message)
 
-    def send_email_verification(
+    async def send_email_verification(
         self,
         email: str,
         user_name: str,
@@ -162,12 +334,13 @@ class NotificationProducer:
         correlation_id: str = None
     ) -> str:
         """Send email verification notification"""
+        user_id_str = str(user_id)
         message = NotificationMessage(
             channel=Channel.EMAIL,
             template_slug="email_verification",
             recipient=RecipientSchema(
                 email=email,
-                user_id=str(user_id),
+                user_id=user_id_str,
                 name=user_name
             ),
             language=language,
@@ -177,12 +350,14 @@ class NotificationProducer:
             },
             priority=Priority.HIGH,
             metadata={
-                "source_service": "auth-service",
-                "correlation_id": correlation_id or str(uuid4()),
-                "user_id": str(user_id)
+                "source_service": SOURCE_SERVICE,
+                "correlation_id": correlation_id or self._default_correlation_id(
+                    "email_verification", email, user_id_str
+                ),
+                "user_id": user_id_str
             }
         )
-        return self._send_message(message)
+        return await self._send_message(message)
 
 
 # Global instance
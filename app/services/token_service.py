@@ -1,13 +1,25 @@
 from datetime import datetime, timedelta
-from typing import Optional
+from typing import NamedTuple, Optional
 from uuid import UUID
-from sqlalchemy import select
+from sqlalchemy import select, delete, update
 from sqlalchemy.ext.asyncio import AsyncSession
 from app.core.security import security_service
 from app.models.refresh_token import RefreshToken
 from app.models.user import User
+from app.repositories.user_repository import invalidate_cached_user
 from app.core.config import settings
 
+# Rows deleted per statement during cleanup; keeps each transaction's lock
+# set small enough not to stall login/refresh traffic
+CLEANUP_BATCH_SIZE = 1000
+
+
+class RefreshTokenInfo(NamedTuple):
+    """Columns of a refresh token needed to validate it and load its user"""
+    user_id: UUID
+    expires_at: datetime
+    is_revoked: bool
+
 
 class TokenService:
     """Service for managing refresh tokens"""
@@ -32,67 +44,116 @@ class TokenService:
             ip_address=ip_address
         )
 
+        # id and token are generated client-side and sessions don't expire on
+        # commit, so no refresh round-trip is needed to read them back
         self.db.add(refresh_token)
         await self.db.commit()
-        await self.db.refresh(refresh_token)
 
         return refresh_token
 
-    async def verify_refresh_token(self, token: str) -> Optional[RefreshToken]:
-        """Verify and return a refresh token if valid"""
+    async def verify_refresh_token(self, token: str) -> Optional[RefreshTokenInfo]:
+        """
+        Verify a refresh token and return its owner and expiry if valid
+
+        Only the columns needed for validation are selected, so no ORM
+        object is loaded on the refresh path; the expiry and revocation
+        checks still go through RefreshToken.is_valid().
+        """
         result = await self.db.execute(
-            select(RefreshToken).where(RefreshToken.token == token)
+            select(
+                RefreshToken.user_id,
+                RefreshToken.expires_at,
+                RefreshToken.is_revoked
+            ).where(RefreshToken.token == token)
         )
-        refresh_token = result.scalar_one_or_none()
+        row = result.first()
 
-        if not refresh_token or not refresh_token.is_valid():
+        if row is None:
             return None
 
-        return refresh_token
-
-    async def revoke_refresh_token(self, token: str) -> bool:
-        """Revoke a specific refresh token"""
-        result = await self.db.execute(
-            select(RefreshToken).where(RefreshToken.token == token)
+        token_info = RefreshTokenInfo(*row)
+        # Transient instance so validity comes from the model's own rules
+        candidate = RefreshToken(
+            expires_at=token_info.expires_at,
+            is_revoked=token_info.is_revoked
         )
-        refresh_token = result.scalar_one_or_none()
+        if not candidate.is_valid():
+            return None
 
-        if refresh_token:
-            refresh_token.is_revoked = True
-            await self.db.commit()
-            return True
+        return token_info
 
-        return False
+    async def revoke_refresh_token(self, token: str) -> bool:
+        """
+        Revoke a specific refresh token
 
-    async def revoke_all_user_tokens(self, user_id: UUID):
-        """Revoke all refresh tokens for a user"""
+        Returns:
+            True if an active token was revoked, False if it was unknown
+            or already revoked
+        """
         result = await self.db.execute(
-            select(RefreshToken).where(
-                RefreshToken.user_id == user_id,
+            update(RefreshToken)
+            .where(
+                RefreshToken.token == token,
                 RefreshToken.is_revoked == False
             )
+            .values(is_revoked=True)
+            .execution_options(synchronize_session=False)
         )
-        tokens = result.scalars().all()
+        await self.db.commit()
 
-        for token in tokens:
-            token.is_revoked = True
+        return result.rowcount > 0
 
+    async def revoke_all_user_tokens(self, user_id: UUID):
+        """Revoke all refresh tokens for a user with a single UPDATE"""
+        await self.db.execute(
+            update(RefreshToken)
+            .where(
+                RefreshToken.user_id == user_id,
+                RefreshToken.is_revoked == False  # don't rewrite already-revoked rows
+            )
+            .values(is_revoked=True)
+            .execution_options(synchronize_session=False)
+        )
         await self.db.commit()
+        # After the commit, so a concurrent lookup can't re-cache the old row
+        invalidate_cached_user(user_id)
+
+    async def cleanup_expired_tokens(self) -> int:
+        """
+        Delete expired refresh tokens in batches of CLEANUP_BATCH_SIZE
+
+        Each batch claims its ids with SELECT ... FOR UPDATE SKIP LOCKED,
+        deletes them and commits, so concurrent cleanup workers take
+        disjoint batches instead of contending on the same rows.
+        """
+        now = datetime.utcnow()
+        total = 0
+
+        while True:
+            result = await self.db.execute(
+                select(RefreshToken.id)
+                .where(RefreshToken.expires_at < now)
+                .limit(CLEANUP_BATCH_SIZE)
+                .with_for_update(skip_locked=True)
+            )
+            expired_ids = result.scalars().all()
 
-    async def cleanup_expired_tokens(self):
-        """Delete expired refresh tokens"""
-        result = await self.db.execute(
-            select(RefreshToken).where(
-                RefreshToken.expires_at < datetime.utcnow()
+            if not expired_ids:
+                await self.db.commit()
+                break
+
+            await self.db.execute(
+                delete(RefreshToken)
+                .where(RefreshToken.id.in_(expired_ids))
+                .execution_options(synchronize_session=False)
             )
-        )
-        expired_tokens = result.scalars().all()
+            await self.db.commit()
 
-        for token in expired_tokens:
-            await self.db.delete(token)
+            total += len(expired_ids)
+            if len(expired_ids) < CLEANUP_BATCH_SIZE:
+                break
 
-        await self.db.commit()
-        return len(expired_tokens)
+        return total
 
 
 def create_access_token(user: User) -> str:
@@ -1,5 +1,6 @@
-from typing import Optional
-from uuid import UUID, uuid4
+import asyncio
+from typing import Optional, Set
+from uuid import UUID
 from fastapi import HTTPException, status, BackgroundTasks
 from sqlalchemy.ext.asyncio import AsyncSession
 from app.repositories.user_repository import UserRepository
@@ -14,6 +15,27 @@ import logging
 
 logger = logging.getLogger(__name__)
 
+# Cap on welcome notifications scheduled but not yet handed to the producer;
+# signup waits for a slot rather than piling up unbounded tasks
+MAX_PENDING_NOTIFICATIONS = 100
+_notification_slots = asyncio.Semaphore(MAX_PENDING_NOTIFICATIONS)
+# Strong references so pending tasks aren't garbage collected mid-flight
+_pending_notifications: Set[asyncio.Task] = set()
+
+
+async def _send_welcome_notification(**kwargs) -> None:
+    """Queue the welcome email; failures are logged and never reach signup"""
+    try:
+        message_id = await notification_producer.send_welcome(**kwargs)
+        logger.info("welcome_notification_queued", extra={"message_id": message_id})
+    except Exception as e:
+        logger.error(
+            "welcome_notification_failed",
+            extra={"user_id": str(kwargs.get("user_id")), "error": str(e)}
+        )
+    finally:
+        _notification_slots.release()
+
 
 class UserService:
     """Service for user business logic"""
@@ -32,20 +54,20 @@ class UserService:
         background_tasks: Optional[BackgroundTasks] = None
     ) -> TokenResponse:
         """Register a new user"""
-        # Check if user already exists
-        existing_user = await self.user_repo.get_by_email(signup_data.email)
-        if existing_user:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="Email already registered"
-            )
-
-        # Hash password and create user
-        hashed_password = security_service.get_password_hash(signup_data.password)
+        # Hash password off the event loop (bcrypt is CPU-bound) and create user
+        # (None if the email is already taken)
+        hashed_password = await asyncio.to_thread(
+            security_service.get_password_hash, signup_data.password
+        )
         user = await self.user_repo.create(
             email=signup_data.email,
             hashed_password=hashed_password
         )
+        if user is None:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Email already registered"
+            )
 
         # Get language from signup data (default to 'en' if not provided)
         language = signup_data.language or "en"
@@ -78,17 +100,19 @@ class UserService:
             ip_address=ip_address
         )
 
-        # Send welcome notification via SQS
-        message_id = notification_producer.send_welcome(
-            email=signup_data.email,
-            user_name="hello world",
-            login_url="https://github.com/erimerturk/herm-notification-service/settings/access",
-            user_id=user.id,
-            language=language,  # Use detected language
-            correlation_id=str(uuid4())
+        # Send welcome notification via SQS without delaying the response
+        await _notification_slots.acquire()
+        task = asyncio.create_task(
+            _send_welcome_notification(
+                email=signup_data.email,
+                user_name="hello world",
+                login_url="https://github.com/erimerturk/herm-notification-service/settings/access",
+                user_id=user.id,
+                language=language  # Use detected language
+            )
         )
-
-        logger.info(f"Queued welcome notification: {message_id}")
+        _pending_notifications.add(task)
+        task.add_done_callback(_pending_notifications.discard)
 
         return TokenResponse(
             access_token=access_token,
@@ -111,8 +135,11 @@ class UserService:
                 detail="Incorrect email or password"
             )
 
-        # Verify password
-        if not security_service.verify_password(login_data.password, user.hashed_password):
+        # Verify password off the event loop (bcrypt is CPU-bound)
+        password_ok = await asyncio.to_thread(
+            security_service.verify_password, login_data.password, user.hashed_password
+        )
+        if not password_ok:
             raise HTTPException(
                 status_code=status.HTTP_401_UNAUTHORIZED,
                 detail="Incorrect email or password"
@@ -159,7 +186,7 @@ class UserService:
                 detail="Could not validate credentials"
             )
         
-        user = await self.user_repo.get_by_id(UUID(user_id))
+        user = await self.user_repo.get_active_by_id_cached(UUID(user_id))
         if not user:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
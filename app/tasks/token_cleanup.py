@@ -17,12 +17,28 @@ Or with APScheduler in your FastAPI app:
     scheduler.start()
 """
 
-from datetime import datetime
+import asyncio
+import logging
 from sqlalchemy.ext.asyncio import AsyncSession
+from app.core.logging_config import setup_logging
 from app.db.session import AsyncSessionLocal
 from app.services.token_service import TokenService
 from app.services.reset_password_service import ResetPasswordService
 
+logger = logging.getLogger(__name__)
+
+
+async def _cleanup_refresh_tokens() -> int:
+    """Cleanup expired refresh tokens on a dedicated session"""
+    async with AsyncSessionLocal() as session:
+        return await TokenService(session).cleanup_expired_tokens()
+
+
+async def _cleanup_password_reset_tokens() -> int:
+    """Cleanup expired password reset tokens on a dedicated session"""
+    async with AsyncSessionLocal() as session:
+        return await ResetPasswordService(session).cleanup_expired_tokens()
+
 
 async def cleanup_expired_tokens_task():
     """
@@ -31,29 +47,35 @@ async def cleanup_expired_tokens_task():
     This function should be called by a scheduler (e.g., cron, APScheduler)
     to periodically remove expired tokens.
 
+    The two tables are cleaned concurrently on separate sessions. If one
+    cleanup fails, the other still completes and its count is reported
+    before the error is re-raised.
+
     Returns:
         dict: Number of tokens deleted by type
     """
-    async with AsyncSessionLocal() as session:
-        try:
-            # Cleanup refresh tokens
-            token_service = TokenService(session)
-            refresh_count = await token_service.cleanup_expired_tokens()
-            print(f"[{datetime.utcnow()}] Cleaned up {refresh_count} expired refresh tokens")
-
-            # Cleanup password reset tokens
-            reset_service = ResetPasswordService(session)
-            reset_count = await reset_service.cleanup_expired_tokens()
-            print(f"[{datetime.utcnow()}] Cleaned up {reset_count} expired password reset tokens")
-
-            return {
-                "refresh_tokens": refresh_count,
-                "password_reset_tokens": reset_count,
-                "total": refresh_count + reset_count
-            }
-        except Exception as e:
-            print(f"[{datetime.utcnow()}] Error cleaning up expired tokens: {e}")
-            raise
+    refresh_result, reset_result = await asyncio.gather(
+        _cleanup_refresh_tokens(),
+        _cleanup_password_reset_tokens(),
+        return_exceptions=True
+    )
+
+    errors = []
+    for label, result in (("refresh", refresh_result), ("password reset", reset_result)):
+        if isinstance(result, Exception):
+            logger.error("Error cleaning up expired %s tokens: %s", label, result)
+            errors.append(result)
+        else:
+            logger.info("Cleaned up %d expired %s tokens", result, label)
+
+    if errors:
+        raise errors[0]
+
+    return {
+        "refresh_tokens": refresh_result,
+        "password_reset_tokens": reset_result,
+        "total": refresh_result + reset_result
+    }
 
 
 async def run_cleanup():
@@ -63,11 +85,13 @@ async def run_cleanup():
     Usage:
         python -m app.tasks.token_cleanup
     """
+    setup_logging()
     result = await cleanup_expired_tokens_task()
-    print(f"Cleanup completed. Removed {result['total']} expired tokens "
-          f"({result['refresh_tokens']} refresh, {result['password_reset_tokens']} password reset).")
+    logger.info(
+        "Cleanup completed. Removed %d expired tokens (%d refresh, %d password reset).",
+        result["total"], result["refresh_tokens"], result["password_reset_tokens"]
+    )
 
 
 if __name__ == "__main__":
-    import asyncio
     asyncio.run(run_cleanup())
@@ -1,12 +1,39 @@
+import os
+
+# Under pytest-xdist each worker gets its own schema so parallel workers
+# never see each other's rows. Models read the schema at import time, so
+# this must run before anything from app is imported.
+if os.environ.get("PYTEST_XDIST_WORKER"):
+    os.environ["DATABASE_SCHEMA"] = f"test_{os.environ['PYTEST_XDIST_WORKER']}"
+
+# bcrypt's minimum cost; hashing speed isn't under test and the default
+# 12 rounds dominated suite runtime
+os.environ.setdefault("PASSWORD_HASH_ROUNDS", "4")
+
 import pytest
 import pytest_asyncio
 import asyncio
-from typing import AsyncGenerator
-from httpx import AsyncClient
+from itertools import cycle
+from typing import AsyncGenerator, Iterator
+from uuid import UUID, uuid4
+from httpx import AsyncClient, ASGITransport
+from sqlalchemy import delete, insert, text
 from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession, async_sessionmaker
+
+try:
+    import uvloop  # installed with uvicorn[standard]
+except ImportError:
+    uvloop = None
+
 from app.main import app
 from app.db.session import Base, get_db
 from app.core.config import settings
+from app.core.security import security_service
+from app.middleware import rate_limit
+from app.models.password_reset_token import PasswordResetToken
+from app.models.user import User
+from app.repositories import user_repository
+from app.services.token_service import create_access_token
 
 # Test database URL
 TEST_DATABASE_URL = settings.DATABASE_URL.replace("/email_integration", "/test_email_integration")
@@ -15,6 +42,9 @@ TEST_DATABASE_URL = settings.DATABASE_URL.replace("/email_integration", "/test_e
 test_engine = create_async_engine(
     TEST_DATABASE_URL,
     echo=False,
+    pool_size=settings.DATABASE_POOL_SIZE,
+    max_overflow=settings.DATABASE_MAX_OVERFLOW,
+    pool_recycle=settings.DATABASE_POOL_RECYCLE,
     pool_pre_ping=True,
 )
 
@@ -24,45 +54,164 @@ TestSessionLocal = async_sessionmaker(
     expire_on_commit=False,
 )
 
+# Where app.main mounts the auth router
+AUTH_PREFIX = "/herm-auth/api/v1/auth"
+
+TEST_USER_PASSWORD = "TestPassword123!"
+# Hashed once at import so user fixtures don't pay bcrypt cost per test
+TEST_USER_PASSWORD_HASH = security_service.get_password_hash(TEST_USER_PASSWORD)
+# Users inserted once per test module and handed out by test_user
+USER_POOL_SIZE = 12
+
 
 @pytest.fixture(scope="session")
 def event_loop():
-    """Create event loop for async tests"""
+    """Create event loop for async tests, on uvloop when it's installed"""
     try:
         loop = asyncio.get_running_loop()
     except RuntimeError:
-        loop = asyncio.new_event_loop()
+        loop = uvloop.new_event_loop() if uvloop else asyncio.new_event_loop()
     yield loop
     loop.close()
 
 
-@pytest_asyncio.fixture(scope="function")
-async def db_session() -> AsyncGenerator[AsyncSession, None]:
-    """Create test database session"""
-    # Create all tables
+@pytest_asyncio.fixture(scope="session")
+async def db_schema() -> AsyncGenerator[None, None]:
+    """Create all tables once for the test session and drop them afterwards"""
     async with test_engine.begin() as conn:
+        await conn.execute(text(f'CREATE SCHEMA IF NOT EXISTS "{settings.DATABASE_SCHEMA}"'))
         await conn.run_sync(Base.metadata.create_all)
-    
-    # Create session
-    async with TestSessionLocal() as session:
-        yield session
-        # Rollback any uncommitted changes
-        await session.rollback()
 
-    # Drop all tables
+    yield
+
     async with test_engine.begin() as conn:
         await conn.run_sync(Base.metadata.drop_all)
+        # Per-worker schemas exist only for this run; the shared one stays
+        if os.environ.get("PYTEST_XDIST_WORKER"):
+            await conn.execute(text(f'DROP SCHEMA IF EXISTS "{settings.DATABASE_SCHEMA}" CASCADE'))
+    await test_engine.dispose()
 
 
 @pytest_asyncio.fixture(scope="function")
-async def client(db_session: AsyncSession) -> AsyncGenerator[AsyncClient, None]:
-    """Create test client"""
+async def db_session(db_schema) -> AsyncGenerator[AsyncSession, None]:
+    """
+    Create test database session
+
+    The session runs inside an outer transaction that is rolled back after
+    the test, so commits made by the code under test only release a
+    SAVEPOINT and no DDL runs between tests.
+    """
+    async with test_engine.connect() as conn:
+        transaction = await conn.begin()
+
+        async with TestSessionLocal(
+            bind=conn,
+            join_transaction_mode="create_savepoint"
+        ) as session:
+            yield session
+
+        await transaction.rollback()
+
+
+@pytest.fixture(scope="session")
+def token_pool() -> list:
+    """
+    64 password reset tokens generated once per session, for tests to pop()
+
+    Made by PasswordResetToken.generate_token itself, so they have the same
+    length and alphabet as real reset tokens.
+    """
+    return [PasswordResetToken.generate_token() for _ in range(64)]
+
+
+@pytest.fixture(autouse=True)
+def rate_limiter(monkeypatch) -> rate_limit.RateLimiter:
+    """Give every test a fresh in-memory rate limiter"""
+    limiter = rate_limit.RateLimiter()
+    monkeypatch.setattr(rate_limit, "rate_limiter", limiter)
+    return limiter
+
+
+@pytest.fixture(autouse=True)
+def user_cache() -> Iterator[None]:
+    """
+    Empty the cached active users around every test
+
+    Pooled user ids are reused after each test's rollback, so a user cached
+    by one test must not be served to the next.
+    """
+    user_repository._user_cache.clear()
+    yield
+    user_repository._user_cache.clear()
+
+
+@pytest_asyncio.fixture(scope="session")
+async def http_client() -> AsyncGenerator[AsyncClient, None]:
+    """Create one test client shared by the whole session"""
+    # Call the ASGI app in-process; no sockets or HTTP framing involved
+    transport = ASGITransport(app=app)
+    async with AsyncClient(transport=transport, base_url="http://test") as ac:
+        yield ac
+
+
+@pytest_asyncio.fixture(scope="function")
+async def client(
+    http_client: AsyncClient,
+    db_session: AsyncSession
+) -> AsyncGenerator[AsyncClient, None]:
+    """Shared test client bound to this test's database session"""
     async def override_get_db():
         yield db_session
     
     app.dependency_overrides[get_db] = override_get_db
+    # Don't leak refresh token cookies from earlier tests
+    http_client.cookies.clear()
     
-    async with AsyncClient(app=app, base_url="http://test") as ac:
-        yield ac
+    yield http_client
     
     app.dependency_overrides.clear()
+
+
+@pytest_asyncio.fixture(scope="module")
+async def user_pool(db_schema) -> AsyncGenerator[Iterator[UUID], None]:
+    """
+    Insert USER_POOL_SIZE active, verified users in one executemany
+
+    The rows are committed outside the per-test transactions, so every
+    test in the module sees them, and are deleted when the module ends.
+    Yields an endless round-robin over their ids; changes a test makes to
+    a pooled user are rolled back with the rest of its transaction.
+    """
+    user_ids = [uuid4() for _ in range(USER_POOL_SIZE)]
+
+    async with test_engine.begin() as conn:
+        await conn.execute(
+            insert(User),
+            [
+                {
+                    "id": user_id,
+                    "email": f"user-{user_id.hex[:12]}@example.com",
+                    "hashed_password": TEST_USER_PASSWORD_HASH,
+                    "is_active": True,
+                    "is_verified": True
+                }
+                for user_id in user_ids
+            ]
+        )
+
+    yield cycle(user_ids)
+
+    async with test_engine.begin() as conn:
+        await conn.execute(delete(User).where(User.id.in_(user_ids)))
+
+
+@pytest_asyncio.fixture(scope="function")
+async def test_user(db_session: AsyncSession, user_pool: Iterator[UUID]) -> User:
+    """Hand out an active, verified user from the module's pool"""
+    return await db_session.get(User, next(user_pool))
+
+
+@pytest_asyncio.fixture(scope="function")
+async def auth_headers(test_user: User) -> dict:
+    """Bearer auth headers for test_user, minted without a signup request"""
+    return {"Authorization": f"Bearer {create_access_token(test_user)}"}
@@ -1,16 +1,25 @@
 import pytest
 from httpx import AsyncClient
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.models.refresh_token import RefreshToken
+from app.models.user import User
+from app.services.token_service import TokenService
+from tests.conftest import AUTH_PREFIX
+
+# Shared request body for the signup/login tests; httpx only reads it
+USER_CREDENTIALS = {
+    "email": "test@example.com",
+    "password": "testpassword123"
+}
 
 
 @pytest.mark.asyncio
 async def test_signup_endpoint(client: AsyncClient):
     """Test signup endpoint"""
     response = await client.post(
-        "/api/v1/auth/signup",
-        json={
-            "email": "test@example.com",
-            "password": "testpassword123"
-        }
+        f"{AUTH_PREFIX}/signup",
+        json=USER_CREDENTIALS
     )
     
     assert response.status_code == 201
@@ -24,7 +33,7 @@ async def test_signup_endpoint(client: AsyncClient):
 async def test_signup_invalid_email(client: AsyncClient):
     """Test signup with invalid email"""
     response = await client.post(
-        "/api/v1/auth/signup",
+        f"{AUTH_PREFIX}/signup",
         json={
             "email": "invalid-email",
             "password": "testpassword123"
@@ -38,7 +47,7 @@ async def test_signup_invalid_email(client: AsyncClient):
 async def test_signup_short_password(client: AsyncClient):
     """Test signup with short password"""
     response = await client.post(
-        "/api/v1/auth/signup",
+        f"{AUTH_PREFIX}/signup",
         json={
             "email": "test@example.com",
             "password": "short"
@@ -53,20 +62,14 @@ async def test_login_endpoint(client: AsyncClient):
     """Test login endpoint"""
     # First signup
     await client.post(
-        "/api/v1/auth/signup",
-        json={
-            "email": "test@example.com",
-            "password": "testpassword123"
-        }
+        f"{AUTH_PREFIX}/signup",
+        json=USER_CREDENTIALS
     )
     
     # Then login
     response = await client.post(
-        "/api/v1/auth/login",
-        json={
-            "email": "test@example.com",
-            "password": "testpassword123"
-        }
+        f"{AUTH_PREFIX}/login",
+        json=USER_CREDENTIALS
     )
     
     assert response.status_code == 200
@@ -76,28 +79,20 @@ async def test_login_endpoint(client: AsyncClient):
 
 
 @pytest.mark.asyncio
-async def test_get_current_user(client: AsyncClient):
+async def test_get_current_user(
+    client: AsyncClient,
+    test_user: User,
+    auth_headers: dict
+):
     """Test get current user endpoint"""
-    # Signup
-    signup_response = await client.post(
-        "/api/v1/auth/signup",
-        json={
-            "email": "test@example.com",
-            "password": "testpassword123"
-        }
-    )
-    
-    token = signup_response.json()["access_token"]
-    
-    # Get current user
     response = await client.get(
-        "/api/v1/auth/me",
-        headers={"Authorization": f"Bearer {token}"}
+        f"{AUTH_PREFIX}/me",
+        headers=auth_headers
     )
     
     assert response.status_code == 200
     data = response.json()
-    assert data["email"] == "test@example.com"
+    assert data["email"] == test_user.email
     assert "id" in data
     assert data["is_active"] is True
 
@@ -106,8 +101,32 @@ async def test_get_current_user(client: AsyncClient):
 async def test_get_current_user_invalid_token(client: AsyncClient):
     """Test get current user with invalid token"""
     response = await client.get(
-        "/api/v1/auth/me",
+        f"{AUTH_PREFIX}/me",
         headers={"Authorization": "Bearer invalid_token"}
     )
     
     assert response.status_code == 401
+
+
+@pytest.mark.asyncio
+async def test_logout_all_revokes_every_refresh_token(
+    client: AsyncClient,
+    db_session: AsyncSession,
+    test_user: User,
+    auth_headers: dict
+):
+    """Test logout-all revokes all of the user's refresh tokens"""
+    token_service = TokenService(db_session)
+    for device in ("laptop", "phone"):
+        await token_service.create_refresh_token(test_user, device_info=device)
+
+    response = await client.post(
+        f"{AUTH_PREFIX}/logout-all",
+        headers=auth_headers
+    )
+
+    assert response.status_code == 200
+    result = await db_session.execute(
+        select(RefreshToken.is_revoked).where(RefreshToken.user_id == test_user.id)
+    )
+    assert result.scalars().all() == [True, True]
@@ -2,17 +2,37 @@
 
 import pytest
 from httpx import AsyncClient
+from sqlalchemy import insert, select
 from sqlalchemy.ext.asyncio import AsyncSession
 from datetime import datetime, timedelta
 
 from app.models.user import User
 from app.models.password_reset_token import PasswordResetToken
 from app.core.security import security_service
+from tests.conftest import AUTH_PREFIX
+
+
+async def _make_reset_token(
+    state: str,
+    db_session: AsyncSession,
+    user: User
+) -> str:
+    """Insert a reset token for the user that is expired, used or valid"""
+    token = PasswordResetToken(
+        user_id=user.id,
+        expires_at=datetime.utcnow() + (
+            timedelta(hours=-1) if state == "expired" else timedelta(hours=1)
+        ),
+        is_used=state == "used"
+    )
+    db_session.add(token)
+    await db_session.commit()
+    return token.token
 
 
 @pytest.mark.asyncio
 class TestForgotPasswordEndpoint:
-    """Tests for /api/v1/auth/forgot-password endpoint"""
+    """Tests for /herm-auth/api/v1/auth/forgot-password endpoint"""
 
     async def test_forgot_password_with_existing_user_returns_200(
         self,
@@ -21,7 +41,7 @@ class TestForgotPasswordEndpoint:
     ):
         """Test forgot password with existing user returns 200"""
         response = await client.post(
-            "/api/v1/auth/forgot-password",
+            f"{AUTH_PREFIX}/forgot-password",
             json={"email": test_user.email}
         )
 
@@ -36,7 +56,7 @@ class TestForgotPasswordEndpoint:
     ):
         """Test forgot password with non-existent user still returns 200 (security)"""
         response = await client.post(
-            "/api/v1/auth/forgot-password",
+            f"{AUTH_PREFIX}/forgot-password",
             json={"email": "nonexistent@example.com"}
         )
 
@@ -48,11 +68,12 @@ class TestForgotPasswordEndpoint:
 
     async def test_forgot_password_with_invalid_email_returns_422(
         self,
-        client: AsyncClient
+        http_client: AsyncClient
     ):
         """Test forgot password with invalid email format returns 422"""
-        response = await client.post(
-            "/api/v1/auth/forgot-password",
+        # Rejected by request validation, so no database session is needed
+        response = await http_client.post(
+            f"{AUTH_PREFIX}/forgot-password",
             json={"email": "not-an-email"}
         )
 
@@ -66,7 +87,7 @@ class TestForgotPasswordEndpoint:
     ):
         """Test that forgot password creates a password reset token"""
         response = await client.post(
-            "/api/v1/auth/forgot-password",
+            f"{AUTH_PREFIX}/forgot-password",
             json={"email": test_user.email}
         )
 
@@ -94,7 +115,6 @@ class TestForgotPasswordEndpoint:
         """Test that forgot password invalidates old unused tokens"""
         # Create an old token
         old_token = PasswordResetToken(
-            token=PasswordResetToken.generate_token(),
             user_id=test_user.id,
             expires_at=datetime.utcnow() + timedelta(hours=24),
             is_used=False
@@ -104,15 +124,17 @@ class TestForgotPasswordEndpoint:
 
         # Request new token
         response = await client.post(
-            "/api/v1/auth/forgot-password",
+            f"{AUTH_PREFIX}/forgot-password",
             json={"email": test_user.email}
         )
 
         assert response.status_code == 200
 
         # Verify old token is marked as used
-        await db_session.refresh(old_token)
-        assert old_token.is_used is True
+        result = await db_session.execute(
+            select(PasswordResetToken.is_used).where(PasswordResetToken.id == old_token.id)
+        )
+        assert result.scalar_one() is True
 
     async def test_forgot_password_rate_limit(
         self,
@@ -123,14 +145,14 @@ class TestForgotPasswordEndpoint:
         # Make 3 requests (the limit)
         for _ in range(3):
             response = await client.post(
-                "/api/v1/auth/forgot-password",
+                f"{AUTH_PREFIX}/forgot-password",
                 json={"email": test_user.email}
             )
             assert response.status_code == 200
 
         # 4th request should be rate limited
         response = await client.post(
-            "/api/v1/auth/forgot-password",
+            f"{AUTH_PREFIX}/forgot-password",
             json={"email": test_user.email}
         )
 
@@ -138,10 +160,32 @@ class TestForgotPasswordEndpoint:
         data = response.json()
         assert "rate limit" in data["detail"].lower()
 
+    async def test_forgot_password_rate_limit_does_not_block_reset_password(
+        self,
+        client: AsyncClient,
+        test_user: User
+    ):
+        """Test that exhausting the forgot password limit leaves reset password usable"""
+        for _ in range(4):
+            await client.post(
+                f"{AUTH_PREFIX}/forgot-password",
+                json={"email": test_user.email}
+            )
+
+        response = await client.post(
+            f"{AUTH_PREFIX}/reset-password",
+            json={
+                "token": "invalid_token",
+                "new_password": "NewSecurePassword123!"
+            }
+        )
+
+        assert response.status_code == 400
+
 
 @pytest.mark.asyncio
 class TestResetPasswordEndpoint:
-    """Tests for /api/v1/auth/reset-password endpoint"""
+    """Tests for /herm-auth/api/v1/auth/reset-password endpoint"""
 
     async def test_reset_password_with_valid_token_returns_200(
         self,
@@ -152,7 +196,6 @@ class TestResetPasswordEndpoint:
         """Test reset password with valid token returns 200"""
         # Create valid token
         token = PasswordResetToken(
-            token=PasswordResetToken.generate_token(),
             user_id=test_user.id,
             expires_at=datetime.utcnow() + timedelta(hours=1),
             is_used=False
@@ -161,7 +204,7 @@ class TestResetPasswordEndpoint:
         await db_session.commit()
 
         response = await client.post(
-            "/api/v1/auth/reset-password",
+            f"{AUTH_PREFIX}/reset-password",
             json={
                 "token": token.token,
                 "new_password": "NewSecurePassword123!"
@@ -179,7 +222,7 @@ class TestResetPasswordEndpoint:
     ):
         """Test reset password with invalid token returns 400"""
         response = await client.post(
-            "/api/v1/auth/reset-password",
+            f"{AUTH_PREFIX}/reset-password",
             json={
                 "token": "invalid_token",
                 "new_password": "NewSecurePassword123!"
@@ -190,59 +233,38 @@ class TestResetPasswordEndpoint:
         data = response.json()
         assert "invalid" in data["detail"].lower() or "expired" in data["detail"].lower()
 
-    async def test_reset_password_with_expired_token_returns_400(
+    @pytest.mark.parametrize(
+        "token_state,new_password,expected_status",
+        [
+            ("expired", "NewSecurePassword123!", 400),
+            ("used", "NewSecurePassword123!", 400),
+            ("valid", "short", 422),  # Less than 8 characters
+        ]
+    )
+    async def test_reset_password_rejected(
         self,
         client: AsyncClient,
         db_session: AsyncSession,
-        test_user: User
+        test_user: User,
+        token_state: str,
+        new_password: str,
+        expected_status: int
     ):
-        """Test reset password with expired token returns 400"""
-        # Create expired token
-        token = PasswordResetToken(
-            token=PasswordResetToken.generate_token(),
-            user_id=test_user.id,
-            expires_at=datetime.utcnow() - timedelta(hours=1),  # Expired
-            is_used=False
-        )
-        db_session.add(token)
-        await db_session.commit()
+        """Test reset password with a bad token or weak password is rejected"""
+        token = await _make_reset_token(token_state, db_session, test_user)
 
         response = await client.post(
-            "/api/v1/auth/reset-password",
+            f"{AUTH_PREFIX}/reset-password",
             json={
-                "token": token.token,
-                "new_password": "NewSecurePassword123!"
-            }
-        )
-
-        assert response.status_code == 400
-
-    async def test_reset_password_with_used_token_returns_400(
-        self,
-        client: AsyncClient,
-        db_session: AsyncSession,
-        test_user: User
-    ):
-        """Test reset password with used token returns 400"""
-        # Create used token
-        token = PasswordResetToken(
-            token=PasswordResetToken.generate_token(),
-            user_id=test_user.id,
-            expires_at=datetime.utcnow() + timedelta(hours=1),
-            is_used=True  # Already used
-        )
-        db_session.add(token)
-        await db_session.commit()
-
-        response = await client.post(
-            "/api/v1/auth/reset-password",
-            json={
-                "token": token.token,
-                "new_password": "NewSecurePassword123!"
+                "token": token,
+                "new_password": new_password
             }
         )
 
-        assert response.status_code == 400
+        assert response.status_code == expected_status
+        if expected_status == 400:
+            detail = response.json()["detail"].lower()
+            assert "invalid" in detail or "expired" in detail
 
     async def test_reset_password_actually_changes_password(
         self,
@@ -255,7 +277,6 @@ class TestResetPasswordEndpoint:
 
         # Create valid token
         token = PasswordResetToken(
-            token=PasswordResetToken.generate_token(),
             user_id=test_user.id,
             expires_at=datetime.utcnow() + timedelta(hours=1),
             is_used=False
@@ -266,7 +287,7 @@ class TestResetPasswordEndpoint:
         new_password = "NewSecurePassword123!"
 
         response = await client.post(
-            "/api/v1/auth/reset-password",
+            f"{AUTH_PREFIX}/reset-password",
             json={
                 "token": token.token,
                 "new_password": new_password
@@ -276,11 +297,14 @@ class TestResetPasswordEndpoint:
         assert response.status_code == 200
 
         # Verify password was changed
-        await db_session.refresh(test_user)
-        assert test_user.hashed_password != old_hashed_password
+        result = await db_session.execute(
+            select(User.hashed_password).where(User.id == test_user.id)
+        )
+        hashed_password = result.scalar_one()
+        assert hashed_password != old_hashed_password
 
         # Verify new password works
-        assert security_service.verify_password(new_password, test_user.hashed_password)
+        assert security_service.verify_password(new_password, hashed_password)
 
     async def test_reset_password_marks_token_as_used(
         self,
@@ -291,7 +315,6 @@ class TestResetPasswordEndpoint:
         """Test that reset password marks token as used"""
         # Create valid token
         token = PasswordResetToken(
-            token=PasswordResetToken.generate_token(),
             user_id=test_user.id,
             expires_at=datetime.utcnow() + timedelta(hours=1),
             is_used=False
@@ -300,7 +323,7 @@ class TestResetPasswordEndpoint:
         await db_session.commit()
 
         response = await client.post(
-            "/api/v1/auth/reset-password",
+            f"{AUTH_PREFIX}/reset-password",
             json={
                 "token": token.token,
                 "new_password": "NewSecurePassword123!"
@@ -310,9 +333,13 @@ class TestResetPasswordEndpoint:
         assert response.status_code == 200
 
         # Verify token is marked as used
-        await db_session.refresh(token)
-        assert token.is_used is True
-        assert token.used_at is not None
+        result = await db_session.execute(
+            select(PasswordResetToken.is_used, PasswordResetToken.used_at)
+            .where(PasswordResetToken.id == token.id)
+        )
+        is_used, used_at = result.one()
+        assert is_used is True
+        assert used_at is not None
 
     async def test_reset_password_revokes_all_refresh_tokens(
         self,
@@ -323,24 +350,21 @@ class TestResetPasswordEndpoint:
         """Test that reset password revokes all user's refresh tokens"""
         from app.models.refresh_token import RefreshToken
 
-        # Create some refresh tokens
-        refresh_token1 = RefreshToken(
-            token=RefreshToken.generate_token(),
-            user_id=test_user.id,
-            expires_at=datetime.utcnow() + timedelta(days=30),
-            is_revoked=False
-        )
-        refresh_token2 = RefreshToken(
-            token=RefreshToken.generate_token(),
-            user_id=test_user.id,
-            expires_at=datetime.utcnow() + timedelta(days=30),
-            is_revoked=False
+        # Create some refresh tokens in one bulk INSERT
+        await db_session.execute(
+            insert(RefreshToken),
+            [
+                {
+                    "user_id": test_user.id,
+                    "expires_at": datetime.utcnow() + timedelta(days=30),
+                    "is_revoked": False
+                }
+                for _ in range(2)
+            ]
         )
-        db_session.add_all([refresh_token1, refresh_token2])
 
         # Create password reset token
         reset_token = PasswordResetToken(
-            token=PasswordResetToken.generate_token(),
             user_id=test_user.id,
             expires_at=datetime.utcnow() + timedelta(hours=1),
             is_used=False
@@ -350,7 +374,7 @@ class TestResetPasswordEndpoint:
 
         # Reset password
         response = await client.post(
-            "/api/v1/auth/reset-password",
+            f"{AUTH_PREFIX}/reset-password",
             json={
                 "token": reset_token.token,
                 "new_password": "NewSecurePassword123!"
@@ -360,66 +384,43 @@ class TestResetPasswordEndpoint:
         assert response.status_code == 200
 
         # Verify all refresh tokens are revoked
-        await db_session.refresh(refresh_token1)
-        await db_session.refresh(refresh_token2)
-        assert refresh_token1.is_revoked is True
-        assert refresh_token2.is_revoked is True
-
-    async def test_reset_password_with_weak_password_returns_422(
-        self,
-        client: AsyncClient,
-        db_session: AsyncSession,
-        test_user: User
-    ):
-        """Test reset password with weak password returns 422"""
-        # Create valid token
-        token = PasswordResetToken(
-            token=PasswordResetToken.generate_token(),
-            user_id=test_user.id,
-            expires_at=datetime.utcnow() + timedelta(hours=1),
-            is_used=False
-        )
-        db_session.add(token)
-        await db_session.commit()
-
-        # Try with password that's too short
-        response = await client.post(
-            "/api/v1/auth/reset-password",
-            json={
-                "token": token.token,
-                "new_password": "short"  # Less than 8 characters
-            }
+        result = await db_session.execute(
+            select(RefreshToken.is_revoked).where(RefreshToken.user_id == test_user.id)
         )
-
-        assert response.status_code == 422
+        revoked = result.scalars().all()
+        assert len(revoked) == 2
+        assert all(revoked)
 
     async def test_reset_password_rate_limit(
         self,
         client: AsyncClient,
         db_session: AsyncSession,
-        test_user: User
+        test_user: User,
+        token_pool: list
     ):
         """Test that reset password endpoint is rate limited"""
-        # Create tokens for testing rate limit
-        tokens = []
-        for _ in range(6):  # Limit is 5
-            token = PasswordResetToken(
-                token=PasswordResetToken.generate_token(),
-                user_id=test_user.id,
-                expires_at=datetime.utcnow() + timedelta(hours=1),
-                is_used=False
-            )
-            db_session.add(token)
-            tokens.append(token)
-
+        # Create tokens for testing rate limit in one bulk INSERT
+        tokens = [token_pool.pop() for _ in range(6)]  # Limit is 5
+        await db_session.execute(
+            insert(PasswordResetToken),
+            [
+                {
+                    "token": token,
+                    "user_id": test_user.id,
+                    "expires_at": datetime.utcnow() + timedelta(hours=1),
+                    "is_used": False
+                }
+                for token in tokens
+            ]
+        )
         await db_session.commit()
 
         # Make 5 requests (the limit)
         for i in range(5):
             response = await client.post(
-                "/api/v1/auth/reset-password",
+                f"{AUTH_PREFIX}/reset-password",
                 json={
-                    "token": tokens[i].token,
+                    "token": tokens[i],
                     "new_password": f"NewPassword{i}123!"
                 }
             )
@@ -427,9 +428,9 @@ class TestResetPasswordEndpoint:
 
         # 6th request should be rate limited
         response = await client.post(
-            "/api/v1/auth/reset-password",
+            f"{AUTH_PREFIX}/reset-password",
             json={
-                "token": tokens[5].token,
+                "token": tokens[5],
                 "new_password": "NewPassword6123!"
             }
         )
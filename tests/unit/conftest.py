@@ -0,0 +1,64 @@
+import pytest
+from unittest.mock import AsyncMock, MagicMock
+from uuid import uuid4
+from app.models.user import User
+
+
+class _CannedExecute:
+    """
+    Async callable standing in for AsyncSession.execute
+
+    Returns whatever is assigned to return_value; a plain attribute, so
+    setting a canned result costs nothing and there is no call recording.
+    """
+
+    def __init__(self):
+        self.return_value = None
+
+    async def __call__(self, *args, **kwargs):
+        return self.return_value
+
+
+class FakeSession:
+    """
+    Stand-in for AsyncSession exposing only what the services call
+
+    Cheaper than AsyncMock(spec=AsyncSession), which walks the whole
+    AsyncSession class to build its spec.
+    """
+
+    def __init__(self):
+        self.execute = _CannedExecute()
+        self.commit = AsyncMock()
+        self.add = MagicMock()
+        self.refresh = AsyncMock()
+
+    def reset_mock(self):
+        """Clear calls, canned results and side effects"""
+        self.execute.return_value = None
+        for method in (self.commit, self.add, self.refresh):
+            method.reset_mock(return_value=True, side_effect=True)
+
+
+@pytest.fixture(scope="module")
+def shared_mock_db():
+    """Fake database session, built once per module"""
+    return FakeSession()
+
+
+@pytest.fixture
+def mock_db(shared_mock_db):
+    """Fake database session, reset after each test"""
+    yield shared_mock_db
+    shared_mock_db.reset_mock()
+
+
+@pytest.fixture
+def inactive_user() -> User:
+    """Unsaved, deactivated user"""
+    return User(
+        id=uuid4(),
+        email="test@example.com",
+        hashed_password="hashed",
+        is_active=False
+    )
@@ -0,0 +1,40 @@
+import time
+from app.core.cache import TTLCache
+
+
+def test_ttl_cache_returns_value_until_expiry(monkeypatch):
+    """Test that cached values expire after the TTL"""
+    now = 1000.0
+    monkeypatch.setattr(time, "monotonic", lambda: now)
+    cache = TTLCache(maxsize=10, ttl=30)
+
+    cache.set("user", {"email": "test@example.com"})
+    assert cache.get("user") == {"email": "test@example.com"}
+
+    now += 30
+    assert cache.get("user") is None
+
+
+def test_ttl_cache_evicts_least_recently_used():
+    """Test that the least recently used entry is evicted when full"""
+    cache = TTLCache(maxsize=2, ttl=30)
+
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.get("a")
+    cache.set("c", 3)
+
+    assert cache.get("a") == 1
+    assert cache.get("b") is None
+    assert cache.get("c") == 3
+
+
+def test_ttl_cache_invalidate():
+    """Test that invalidated entries are no longer returned"""
+    cache = TTLCache(maxsize=10, ttl=30)
+
+    cache.set("user", 1)
+    cache.invalidate("user")
+    cache.invalidate("missing")
+
+    assert cache.get("user") is None
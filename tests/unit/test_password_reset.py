@@ -1,10 +1,12 @@
 """Unit tests for password reset functionality"""
 
 import pytest
+import time
 from datetime import datetime, timedelta
+from itertools import cycle
 from uuid import uuid4
+from types import SimpleNamespace
 from unittest.mock import AsyncMock, MagicMock, patch
-from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.models.password_reset_token import PasswordResetToken
 from app.models.user import User
@@ -12,10 +14,47 @@ from app.services.forgot_password_service import ForgotPasswordService
 from app.services.reset_password_service import ResetPasswordService
 from fastapi import HTTPException
 
+# Precomputed ids handed out round-robin; the objects are never persisted
+_UUID_POOL = [uuid4() for _ in range(32)]
+_uuids = cycle(_UUID_POOL)
+
+# Stand-ins for server-populated fields; only compared, never used as secrets
+_FIXED_UUID = next(_uuids)
+_FIXED_TOKEN = "a" * 64
+_FIXED_NOW = datetime(2024, 1, 1, 12, 0, 0)
+# Expiry times far enough from any real clock to need no utcnow() call
+PAST_DT = datetime(2000, 1, 1)
+FUTURE_DT = datetime(2999, 1, 1)
+
+
+def _result(value):
+    """Stand-in for a Result whose scalar_one_or_none() returns value"""
+    return SimpleNamespace(scalar_one_or_none=lambda: value)
+
+
+def _reset_token(expires_at: datetime, is_used: bool) -> PasswordResetToken:
+    """Build an unsaved reset token"""
+    return PasswordResetToken(
+        id=next(_uuids),
+        token="test_token",
+        user_id=next(_uuids),
+        expires_at=expires_at,
+        is_used=is_used
+    )
+
 
 class TestPasswordResetTokenModel:
     """Tests for PasswordResetToken model"""
 
+    @pytest.fixture(autouse=True)
+    def frozen_now(self, monkeypatch) -> datetime:
+        """Freeze the model's clock so expiry checks don't read real time"""
+        now = datetime(2024, 1, 1, 12, 0, 0)
+        frozen_datetime = MagicMock()
+        frozen_datetime.utcnow.return_value = now
+        monkeypatch.setattr("app.models.password_reset_token.datetime", frozen_datetime)
+        return now
+
     def test_generate_token_returns_string(self):
         """Test that generate_token returns a string"""
         token = PasswordResetToken.generate_token()
@@ -24,104 +63,52 @@ class TestPasswordResetTokenModel:
 
     def test_generate_token_is_unique(self):
         """Test that generated tokens are unique"""
-        tokens = [PasswordResetToken.generate_token() for _ in range(100)]
-        assert len(tokens) == len(set(tokens))  # All tokens should be unique
-
-    def test_is_expired_returns_true_for_expired_token(self):
-        """Test that is_expired returns True for expired tokens"""
+        seen = set()
+        for _ in range(100):
+            token = PasswordResetToken.generate_token()
+            assert token not in seen  # All tokens should be unique
+            seen.add(token)
+
+    @pytest.mark.parametrize(
+        "delta_hours,is_used,expect_expired,expect_valid",
+        [
+            (-1, False, True, False),  # Expired 1 hour ago
+            (1, False, False, True),  # Expires in 1 hour
+            (1, True, False, False),  # Already used
+            (-1, True, True, False),  # Expired and used
+        ]
+    )
+    def test_token_state(self, frozen_now, delta_hours, is_used, expect_expired, expect_valid):
+        """Test is_expired and is_valid across expiry and used states"""
         token = PasswordResetToken(
             token="test_token",
-            user_id=uuid4(),
-            expires_at=datetime.utcnow() - timedelta(hours=1)  # Expired 1 hour ago
+            user_id=next(_uuids),
+            expires_at=frozen_now + timedelta(hours=delta_hours),
+            is_used=is_used
         )
-        assert token.is_expired() is True
-
-    def test_is_expired_returns_false_for_valid_token(self):
-        """Test that is_expired returns False for valid tokens"""
-        token = PasswordResetToken(
-            token="test_token",
-            user_id=uuid4(),
-            expires_at=datetime.utcnow() + timedelta(hours=1)  # Expires in 1 hour
-        )
-        assert token.is_expired() is False
-
-    def test_is_valid_returns_true_for_valid_token(self):
-        """Test that is_valid returns True for valid tokens"""
-        token = PasswordResetToken(
-            token="test_token",
-            user_id=uuid4(),
-            expires_at=datetime.utcnow() + timedelta(hours=1),
-            is_used=False
-        )
-        assert token.is_valid() is True
-
-    def test_is_valid_returns_false_for_expired_token(self):
-        """Test that is_valid returns False for expired tokens"""
-        token = PasswordResetToken(
-            token="test_token",
-            user_id=uuid4(),
-            expires_at=datetime.utcnow() - timedelta(hours=1),
-            is_used=False
-        )
-        assert token.is_valid() is False
-
-    def test_is_valid_returns_false_for_used_token(self):
-        """Test that is_valid returns False for used tokens"""
-        token = PasswordResetToken(
-            token="test_token",
-            user_id=uuid4(),
-            expires_at=datetime.utcnow() + timedelta(hours=1),
-            is_used=True
-        )
-        assert token.is_valid() is False
-
-    def test_is_valid_returns_false_for_expired_and_used_token(self):
-        """Test that is_valid returns False for expired and used tokens"""
-        token = PasswordResetToken(
-            token="test_token",
-            user_id=uuid4(),
-            expires_at=datetime.utcnow() - timedelta(hours=1),
-            is_used=True
-        )
-        assert token.is_valid() is False
+        assert token.is_expired() is expect_expired
+        assert token.is_valid() is expect_valid
 
 
 class TestForgotPasswordService:
     """Tests for ForgotPasswordService"""
 
     @pytest.fixture
-    def mock_db(self):
-        """Mock database session"""
-        db = AsyncMock(spec=AsyncSession)
-        db.execute = AsyncMock()
-        db.commit = AsyncMock()
-        db.add = MagicMock()
-        return db
-
-    @pytest.fixture
-    def service(self, mock_db):
-        """ForgotPasswordService instance"""
+    def service(self, mock_db, monkeypatch):
+        """ForgotPasswordService instance with no response-time padding"""
+        monkeypatch.setattr("app.services.forgot_password_service.MIN_RESPONSE_SECONDS", 0)
         return ForgotPasswordService(mock_db)
 
     @pytest.mark.asyncio
     async def test_get_user_language_code_returns_en_by_default(self, service):
         """Test that get_user_language_code returns 'en' by default"""
-        language_code = await service.get_user_language_code(uuid4())
+        language_code = await service.get_user_language_code(next(_uuids))
         assert language_code == 'en'
 
-    @pytest.mark.asyncio
-    async def test_get_email_template_returns_mock_template(self, service):
-        """Test that get_email_template returns a mock template"""
-        template = await service.get_email_template('forget_password', 'en')
-        assert template is not None
-        assert template.id == 1
-        assert hasattr(template, 'subject')
-        assert hasattr(template, 'content')
-
     @pytest.mark.asyncio
     async def test_create_reset_token_generates_valid_token(self, service, mock_db):
         """Test that create_reset_token generates a valid token"""
-        user_id = uuid4()
+        user_id = next(_uuids)
         ip_address = "192.168.1.1"
 
         # Mock empty result for existing tokens query
@@ -129,13 +116,13 @@ class TestForgotPasswordService:
         mock_result.scalars = MagicMock(return_value=MagicMock(all=MagicMock(return_value=[])))
         mock_db.execute.return_value = mock_result
 
-        # Create new refresh method that returns the token
+        # Populate server-side fields on refresh
         async def mock_refresh(obj):
-            obj.id = uuid4()
-            obj.token = PasswordResetToken.generate_token()
-            obj.created_at = datetime.utcnow()
+            obj.id = _FIXED_UUID
+            obj.token = _FIXED_TOKEN
+            obj.created_at = _FIXED_NOW
 
-        mock_db.refresh = mock_refresh
+        mock_db.refresh.side_effect = mock_refresh
 
         token = await service.create_reset_token(user_id, ip_address, expiry_hours=24)
 
@@ -148,113 +135,81 @@ class TestForgotPasswordService:
     async def test_process_forgot_password_returns_false_for_nonexistent_user(self, service, mock_db):
         """Test that process_forgot_password returns False for non-existent users"""
         # Mock empty result (user not found)
-        mock_result = AsyncMock()
-        mock_result.scalar_one_or_none = MagicMock(return_value=None)
-        mock_db.execute.return_value = mock_result
+        mock_db.execute.return_value = _result(None)
 
         result = await service.process_forgot_password("nonexistent@example.com")
 
         assert result is False
 
-
-class TestResetPasswordService:
-    """Tests for ResetPasswordService"""
-
-    @pytest.fixture
-    def mock_db(self):
-        """Mock database session"""
-        db = AsyncMock(spec=AsyncSession)
-        db.execute = AsyncMock()
-        db.commit = AsyncMock()
-        db.add = MagicMock()
-        return db
-
-    @pytest.fixture
-    def service(self, mock_db):
-        """ResetPasswordService instance"""
-        return ResetPasswordService(mock_db)
-
+    @pytest.mark.parametrize("user_id", [None, _FIXED_UUID], ids=["unknown", "existing"])
     @pytest.mark.asyncio
-    async def test_verify_reset_token_returns_none_for_nonexistent_token(self, service, mock_db):
-        """Test that verify_reset_token returns None for non-existent token"""
-        # Mock empty result
-        mock_result = AsyncMock()
-        mock_result.scalar_one_or_none = MagicMock(return_value=None)
-        mock_db.execute.return_value = mock_result
-
-        result = await service.verify_reset_token("invalid_token")
-
-        assert result is None
-
-    @pytest.mark.asyncio
-    async def test_verify_reset_token_returns_none_for_expired_token(self, service, mock_db):
-        """Test that verify_reset_token returns None for expired token"""
-        expired_token = PasswordResetToken(
-            id=uuid4(),
-            token="expired_token",
-            user_id=uuid4(),
-            expires_at=datetime.utcnow() - timedelta(hours=1),
-            is_used=False
+    async def test_process_forgot_password_pads_to_min_response_time(
+        self,
+        service,
+        mock_db,
+        monkeypatch,
+        user_id
+    ):
+        """Test that both outcomes wait until MIN_RESPONSE_SECONDS has passed"""
+        floor = 0.15
+        monkeypatch.setattr("app.services.forgot_password_service.MIN_RESPONSE_SECONDS", floor)
+        mock_db.execute.return_value = SimpleNamespace(
+            scalar_one_or_none=lambda: user_id,
+            scalars=lambda: SimpleNamespace(all=lambda: [])
         )
+        delays = []
 
-        # Mock result with expired token
-        mock_result = AsyncMock()
-        mock_result.scalar_one_or_none = MagicMock(return_value=expired_token)
-        mock_db.execute.return_value = mock_result
-
-        result = await service.verify_reset_token("expired_token")
+        async def fake_sleep(delay):
+            delays.append(time.monotonic() - started + delay)
 
-        assert result is None
+        started = time.monotonic()
+        with patch("app.services.forgot_password_service.asyncio.sleep", fake_sleep), \
+                patch("app.services.forgot_password_service.notification_producer") as producer:
+            producer.send_password_reset = AsyncMock(return_value="entry-id")
+            await service.process_forgot_password("someone@example.com")
 
-    @pytest.mark.asyncio
-    async def test_verify_reset_token_returns_none_for_used_token(self, service, mock_db):
-        """Test that verify_reset_token returns None for used token"""
-        used_token = PasswordResetToken(
-            id=uuid4(),
-            token="used_token",
-            user_id=uuid4(),
-            expires_at=datetime.utcnow() + timedelta(hours=1),
-            is_used=True
-        )
+        assert len(delays) == 1
+        assert delays[0] >= floor
 
-        # Mock result with used token
-        mock_result = AsyncMock()
-        mock_result.scalar_one_or_none = MagicMock(return_value=used_token)
-        mock_db.execute.return_value = mock_result
 
-        result = await service.verify_reset_token("used_token")
+class TestResetPasswordService:
+    """Tests for ResetPasswordService"""
 
-        assert result is None
+    @pytest.fixture
+    def service(self, mock_db):
+        """ResetPasswordService instance"""
+        return ResetPasswordService(mock_db)
 
     @pytest.mark.asyncio
-    async def test_verify_reset_token_returns_token_for_valid_token(self, service, mock_db):
-        """Test that verify_reset_token returns token for valid token"""
-        valid_token = PasswordResetToken(
-            id=uuid4(),
-            token="valid_token",
-            user_id=uuid4(),
-            expires_at=datetime.utcnow() + timedelta(hours=1),
-            is_used=False
-        )
-
-        # Mock result with valid token
-        mock_result = AsyncMock()
-        mock_result.scalar_one_or_none = MagicMock(return_value=valid_token)
-        mock_db.execute.return_value = mock_result
-
-        result = await service.verify_reset_token("valid_token")
-
-        assert result is not None
-        assert result.token == "valid_token"
-        assert result.is_valid() is True
+    @pytest.mark.parametrize(
+        "make_token,expected_none",
+        [
+            (lambda: None, True),
+            (lambda: _reset_token(expires_at=PAST_DT, is_used=False), True),
+            (lambda: _reset_token(expires_at=FUTURE_DT, is_used=True), True),
+            (lambda: _reset_token(expires_at=FUTURE_DT, is_used=False), False),
+        ],
+        ids=["nonexistent", "expired", "used", "valid"]
+    )
+    async def test_verify_reset_token(self, service, mock_db, make_token, expected_none):
+        """Test that verify_reset_token returns only valid tokens"""
+        # Built per test so no ORM instance is shared between cases
+        token = make_token()
+        mock_db.execute.return_value = _result(token)
+
+        result = await service.verify_reset_token("test_token")
+
+        if expected_none:
+            assert result is None
+        else:
+            assert result is token
+            assert result.is_valid() is True
 
     @pytest.mark.asyncio
     async def test_reset_password_raises_exception_for_invalid_token(self, service, mock_db):
         """Test that reset_password raises HTTPException for invalid token"""
         # Mock empty result (token not found)
-        mock_result = AsyncMock()
-        mock_result.scalar_one_or_none = MagicMock(return_value=None)
-        mock_db.execute.return_value = mock_result
+        mock_db.execute.return_value = _result(None)
 
         with pytest.raises(HTTPException) as exc_info:
             await service.reset_password("invalid_token", "NewPassword123")
@@ -263,34 +218,24 @@ class TestResetPasswordService:
         assert "Invalid or expired" in exc_info.value.detail
 
     @pytest.mark.asyncio
-    async def test_reset_password_raises_exception_for_inactive_user(self, service, mock_db):
+    async def test_reset_password_raises_exception_for_inactive_user(
+        self,
+        service,
+        mock_db,
+        inactive_user: User
+    ):
         """Test that reset_password raises HTTPException for inactive user"""
-        user_id = uuid4()
         valid_token = PasswordResetToken(
-            id=uuid4(),
+            id=next(_uuids),
             token="valid_token",
-            user_id=user_id,
-            expires_at=datetime.utcnow() + timedelta(hours=1),
+            user_id=inactive_user.id,
+            expires_at=FUTURE_DT,
             is_used=False
         )
+        valid_token.user = inactive_user
 
-        inactive_user = User(
-            id=user_id,
-            email="test@example.com",
-            hashed_password="hashed",
-            is_active=False
-        )
-
-        # Mock results for token and user queries
-        def side_effect(*args, **kwargs):
-            result = AsyncMock()
-            if "PasswordResetToken" in str(args):
-                result.scalar_one_or_none = MagicMock(return_value=valid_token)
-            else:
-                result.scalar_one_or_none = MagicMock(return_value=inactive_user)
-            return result
-
-        mock_db.execute.side_effect = side_effect
+        # Mock token query (user is eager-loaded with the token)
+        mock_db.execute.return_value = _result(valid_token)
 
         with pytest.raises(HTTPException) as exc_info:
             await service.reset_password("valid_token", "NewPassword123")
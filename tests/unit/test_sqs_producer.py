@@ -0,0 +1,197 @@
+"""Unit tests for the batching SQS notification producer"""
+
+import asyncio
+import logging
+import pytest
+from uuid import uuid4
+
+from app.core.config import settings
+from app.services.sqs_producer import MAX_BATCH_SIZE, NotificationProducer
+
+STANDARD_QUEUE_URL = "https://sqs.eu-west-1.amazonaws.com/000000000000/notifications"
+FIFO_QUEUE_URL = STANDARD_QUEUE_URL + ".fifo"
+
+# Fixed welcome payload; the default correlation id is derived from it
+WELCOME = {
+    "email": "user@example.com",
+    "user_name": "user",
+    "login_url": "https://example.com/login",
+    "user_id": uuid4()
+}
+
+
+class FakeSQSClient:
+    """Records SendMessageBatch calls; with fail_all every entry comes back Failed"""
+
+    def __init__(self, fail_all: bool = False):
+        self.batches = []
+        self.fail_all = fail_all
+        self.closed = False
+
+    async def get_queue_attributes(self, **kwargs):
+        return {"Attributes": {}}
+
+    async def send_message_batch(self, QueueUrl, Entries):
+        self.batches.append(list(Entries))
+        results = [{"Id": entry["Id"], "MessageId": entry["Id"]} for entry in Entries]
+        if self.fail_all:
+            return {"Successful": [], "Failed": results}
+        return {"Successful": results, "Failed": []}
+
+    @property
+    def entries(self) -> list:
+        return [entry for batch in self.batches for entry in batch]
+
+
+class FakeClientContext:
+    """Async context manager returned by session.client('sqs')"""
+
+    def __init__(self, client: FakeSQSClient):
+        self.client = client
+
+    async def __aenter__(self) -> FakeSQSClient:
+        # Yield once, like a real connect, so concurrent starts can interleave
+        await asyncio.sleep(0)
+        return self.client
+
+    async def __aexit__(self, *exc_info):
+        self.client.closed = True
+
+
+class FakeAioSession:
+    """Stand-in for aioboto3.Session counting the clients it opens"""
+
+    def __init__(self, sqs: FakeSQSClient):
+        self.sqs = sqs
+        self.clients_opened = 0
+
+    def client(self, service_name, **kwargs):
+        self.clients_opened += 1
+        return FakeClientContext(self.sqs)
+
+
+@pytest.fixture
+def make_producer(monkeypatch):
+    """Build a producer for the given queue URL on a fake aioboto3 session"""
+    def _make(queue_url: str = STANDARD_QUEUE_URL, fail_all: bool = False):
+        monkeypatch.setattr(settings, "NOTIFICATION_QUEUE_URL", queue_url)
+        producer = NotificationProducer()
+        producer._session = FakeAioSession(FakeSQSClient(fail_all=fail_all))
+        return producer
+
+    return _make
+
+
+class TestProducerLifecycle:
+    """Tests for lazy start, batching and shutdown"""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_first_sends_open_one_client(self, make_producer):
+        """Test that racing first sends share a single client and flusher"""
+        producer = make_producer()
+
+        await asyncio.gather(*(producer.send_welcome(**WELCOME) for _ in range(3)))
+        flusher = producer._flusher
+        await producer.stop()
+
+        assert producer._session.clients_opened == 1
+        assert flusher.done()
+        assert len(producer._session.sqs.entries) == 3
+
+    @pytest.mark.asyncio
+    async def test_batches_hold_at_most_max_batch_size_entries(self, make_producer):
+        """Test that buffered messages are split into SendMessageBatch-sized batches"""
+        producer = make_producer()
+
+        await asyncio.gather(
+            *(producer.send_welcome(**WELCOME) for _ in range(2 * MAX_BATCH_SIZE + 5))
+        )
+        await producer.stop()
+
+        batches = producer._session.sqs.batches
+        assert all(len(batch) <= MAX_BATCH_SIZE for batch in batches)
+        assert sum(len(batch) for batch in batches) == 2 * MAX_BATCH_SIZE + 5
+
+    @pytest.mark.asyncio
+    async def test_stop_flushes_buffer_and_closes_client(self, make_producer):
+        """Test that stop publishes what is buffered before closing the client"""
+        producer = make_producer()
+        entry_id = await producer.send_welcome(**WELCOME)
+        client = producer._session.sqs
+
+        await producer.stop()
+
+        assert [entry["Id"] for entry in client.entries] == [entry_id]
+        assert client.closed is True
+        assert producer.sqs_client is None
+
+    @pytest.mark.asyncio
+    async def test_send_after_stop_raises(self, make_producer):
+        """Test that a stopped producer refuses sends instead of reopening a client"""
+        producer = make_producer()
+        await producer.start()
+        await producer.stop()
+
+        with pytest.raises(RuntimeError):
+            await producer.send_welcome(**WELCOME)
+
+        assert producer._session.clients_opened == 1
+
+    @pytest.mark.asyncio
+    async def test_failed_batch_entries_are_logged(self, make_producer, caplog):
+        """Test that entries SQS reports as Failed are logged with their id"""
+        producer = make_producer(fail_all=True)
+
+        with caplog.at_level(logging.ERROR, logger="app.services.sqs_producer"):
+            entry_id = await producer.send_welcome(**WELCOME)
+            await producer.stop()
+
+        failures = [r for r in caplog.records if r.getMessage() == "sqs_notification_failed"]
+        assert [r.entry_id for r in failures] == [entry_id]
+
+
+class TestFifoAttributes:
+    """Tests for FIFO group and deduplication ids"""
+
+    @pytest.mark.asyncio
+    async def test_fifo_queue_entries_get_group_and_dedup_ids(self, make_producer):
+        """Test that FIFO entries carry MessageGroupId and MessageDeduplicationId"""
+        producer = make_producer(FIFO_QUEUE_URL)
+
+        await producer.send_welcome(**WELCOME, correlation_id="corr-1")
+        await producer.stop()
+
+        [entry] = producer._session.sqs.entries
+        assert entry["MessageGroupId"] == str(WELCOME["user_id"])
+        assert entry["MessageDeduplicationId"] == "corr-1"
+
+    @pytest.mark.asyncio
+    async def test_standard_queue_entries_have_no_fifo_fields(self, make_producer):
+        """Test that standard queue entries omit the FIFO-only fields"""
+        producer = make_producer(STANDARD_QUEUE_URL)
+
+        await producer.send_welcome(**WELCOME)
+        await producer.stop()
+
+        [entry] = producer._session.sqs.entries
+        assert "MessageGroupId" not in entry
+        assert "MessageDeduplicationId" not in entry
+
+    @pytest.mark.asyncio
+    async def test_same_payload_gets_same_dedup_id(self, make_producer):
+        """Test that retries of one notification deduplicate to the same id"""
+        producer = make_producer(FIFO_QUEUE_URL)
+
+        await producer.send_welcome(**WELCOME)
+        await producer.send_welcome(**WELCOME)
+        await producer.send_welcome(**{**WELCOME, "email": "other@example.com"})
+        await producer.stop()
+
+        first, retry, other = (
+            entry["MessageDeduplicationId"] for entry in producer._session.sqs.entries
+        )
+        assert first == retry
+        assert first != other
+        assert first == NotificationProducer._default_correlation_id(
+            "welcome", WELCOME["email"], str(WELCOME["user_id"])
+        )
@@ -1,19 +1,36 @@
+import asyncio
 import pytest
+from datetime import datetime, timedelta
+from unittest.mock import AsyncMock, patch
 from fastapi import HTTPException
+from app.repositories.user_repository import UserRepository, _user_cache
+from app.services import user_service as user_service_module
+from app.services.reset_password_service import ResetPasswordService
+from app.services.sqs_producer import notification_producer
+from app.services.token_service import TokenService, create_access_token
 from app.services.user_service import UserService
 from app.schemas.user import UserSignup, UserLogin
+from app.models.password_reset_token import PasswordResetToken
+from app.models.user import User
+from tests.conftest import TEST_USER_PASSWORD
+
+# Validated once at import; the service only reads them
+SIGNUP = UserSignup(
+    email="test@example.com",
+    password="testpassword123"
+)
+LOGIN_UNKNOWN_USER = UserLogin(
+    email="nonexistent@example.com",
+    password="testpassword123"
+)
 
 
 @pytest.mark.asyncio
 async def test_user_signup_success(db_session):
     """Test successful user signup"""
     user_service = UserService(db_session)
-    signup_data = UserSignup(
-        email="test@example.com",
-        password="testpassword123"
-    )
     
-    result = await user_service.signup(signup_data)
+    result = await user_service.signup(SIGNUP)
     
     assert result.access_token is not None
     assert result.refresh_token is not None
@@ -21,18 +38,35 @@ async def test_user_signup_success(db_session):
 
 
 @pytest.mark.asyncio
-async def test_user_signup_duplicate_email(db_session):
+async def test_user_signup_survives_welcome_notification_failure(db_session):
+    """Test that a failing producer neither fails signup nor leaks its task"""
+    user_service = UserService(db_session)
+    pending_before = set(user_service_module._pending_notifications)
+    send_welcome = AsyncMock(side_effect=RuntimeError("queue unavailable"))
+
+    with patch.object(notification_producer, "send_welcome", send_welcome):
+        result = await user_service.signup(SIGNUP)
+        welcome_tasks = user_service_module._pending_notifications - pending_before
+        await asyncio.gather(*welcome_tasks)
+        # Done callbacks run on the loop iteration after the task finishes
+        await asyncio.sleep(0)
+
+    assert result.access_token is not None
+    send_welcome.assert_awaited_once()
+    assert len(welcome_tasks) == 1
+    assert not welcome_tasks & user_service_module._pending_notifications
+
+
+@pytest.mark.asyncio
+async def test_user_signup_duplicate_email(db_session, test_user: User):
     """Test user signup with duplicate email"""
     user_service = UserService(db_session)
     signup_data = UserSignup(
-        email="test@example.com",
+        email=test_user.email,
         password="testpassword123"
     )
     
-    # First signup should succeed
-    await user_service.signup(signup_data)
-    
-    # Second signup with same email should fail
+    # Signup with an already registered email should fail
     with pytest.raises(HTTPException) as exc_info:
         await user_service.signup(signup_data)
     
@@ -41,21 +75,13 @@ async def test_user_signup_duplicate_email(db_session):
 
 
 @pytest.mark.asyncio
-async def test_user_login_success(db_session):
+async def test_user_login_success(db_session, test_user: User):
     """Test successful user login"""
     user_service = UserService(db_session)
     
-    # Create user
-    signup_data = UserSignup(
-        email="test@example.com",
-        password="testpassword123"
-    )
-    await user_service.signup(signup_data)
-    
-    # Login
     login_data = UserLogin(
-        email="test@example.com",
-        password="testpassword123"
+        email=test_user.email,
+        password=TEST_USER_PASSWORD
     )
     result = await user_service.login(login_data)
     
@@ -65,20 +91,13 @@ async def test_user_login_success(db_session):
 
 
 @pytest.mark.asyncio
-async def test_user_login_wrong_password(db_session):
+async def test_user_login_wrong_password(db_session, test_user: User):
     """Test user login with wrong password"""
     user_service = UserService(db_session)
     
-    # Create user
-    signup_data = UserSignup(
-        email="test@example.com",
-        password="testpassword123"
-    )
-    await user_service.signup(signup_data)
-    
     # Try login with wrong password
     login_data = UserLogin(
-        email="test@example.com",
+        email=test_user.email,
         password="wrongpassword"
     )
     
@@ -93,12 +112,65 @@ async def test_user_login_nonexistent_user(db_session):
     """Test user login with nonexistent user"""
     user_service = UserService(db_session)
     
-    login_data = UserLogin(
-        email="nonexistent@example.com",
-        password="testpassword123"
-    )
-    
     with pytest.raises(HTTPException) as exc_info:
-        await user_service.login(login_data)
+        await user_service.login(LOGIN_UNKNOWN_USER)
     
     assert exc_info.value.status_code == 401
+
+
+@pytest.mark.asyncio
+async def test_get_current_user_serves_repeat_lookups_from_cache(db_session, test_user: User):
+    """Test that a second lookup of an active user doesn't query the database"""
+    user_service = UserService(db_session)
+    token = create_access_token(test_user)
+    await user_service.get_current_user(token)
+
+    with patch.object(UserRepository, "get_by_id", AsyncMock()) as get_by_id:
+        user = await user_service.get_current_user(token)
+
+    get_by_id.assert_not_awaited()
+    assert user.id == test_user.id
+    assert user.email == test_user.email
+
+
+@pytest.mark.asyncio
+async def test_get_current_user_never_caches_inactive_user(db_session, test_user: User):
+    """Test that an inactive user is rejected and not cached"""
+    test_user.is_active = False
+    await db_session.commit()
+
+    with pytest.raises(HTTPException) as exc_info:
+        await UserService(db_session).get_current_user(create_access_token(test_user))
+
+    assert exc_info.value.status_code == 403
+    assert _user_cache.get(test_user.id) is None
+
+
+@pytest.mark.asyncio
+async def test_logout_all_evicts_cached_user(db_session, test_user: User):
+    """Test that revoking all refresh tokens drops the cached user"""
+    await UserService(db_session).get_current_user(create_access_token(test_user))
+    assert _user_cache.get(test_user.id) is not None
+
+    await TokenService(db_session).revoke_all_user_tokens(test_user.id)
+
+    assert _user_cache.get(test_user.id) is None
+
+
+@pytest.mark.asyncio
+async def test_reset_password_evicts_cached_user(db_session, test_user: User):
+    """Test that resetting the password drops the cached user"""
+    await UserService(db_session).get_current_user(create_access_token(test_user))
+    reset_token = PasswordResetToken(
+        user_id=test_user.id,
+        expires_at=datetime.utcnow() + timedelta(hours=1),
+        is_used=False
+    )
+    db_session.add(reset_token)
+    await db_session.commit()
+
+    await ResetPasswordService(db_session).reset_password(
+        reset_token.token, "NewSecurePassword123!"
+    )
+
+    assert _user_cache.get(test_user.id) is None